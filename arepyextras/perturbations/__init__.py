@@ -12,19 +12,77 @@ from . import resources
 
 __version__ = "1.1.1"
 
+__all__ = [
+    "__version__",
+    "tropospheric_coeff_path",
+    "tropospheric_legendre_coeff",
+    "grid_stations_fine",
+    "grid_stations_coarse",
+]
+
 # tropospheric legendre coefficients
 # these data has been taken from the data management script hosted by VMF Data Server (vmf3.m) that can be found here:
 # https://vmf.geo.tuwien.ac.at/codes/vmf3.m
-tropospheric_coeff_path = res.files(resources).joinpath("troposphere_support", "tropospheric_legendre_coefficients")
-tropospheric_legendre_coeff = dict.fromkeys(
-    ["anm_bh", "anm_bw", "anm_ch", "anm_cw", "bnm_bh", "bnm_bw", "bnm_ch", "bnm_cw"]
-)
-for key in tropospheric_legendre_coeff:
-    tropospheric_legendre_coeff[key] = tropospheric_coeff_path.joinpath(key + ".txt").read_bytes()
+# coefficients are parsed to float64 arrays lazily on first access of tropospheric_legendre_coeff
+_TROPOSPHERIC_LEGENDRE_KEYS = ("anm_bh", "anm_bw", "anm_ch", "anm_cw", "bnm_bh", "bnm_bw", "bnm_ch", "bnm_cw")
+_tropospheric_legendre_coeff = None
 
 # tropospheric grid data stations
 # files can be found here:
 # https://vmf.geo.tuwien.ac.at/station_coord_files/gridpoint_coord_1x1.txt
 # https://vmf.geo.tuwien.ac.at/station_coord_files/gridpoint_coord_5x5.txt
-grid_stations_fine = res.files(resources).joinpath("troposphere_support", "gridpoint_coord_1x1.txt")
-grid_stations_coarse = res.files(resources).joinpath("troposphere_support", "gridpoint_coord_5x5.txt")
+# resource paths (tropospheric_coeff_path, grid_stations_fine, grid_stations_coarse) are resolved lazily as well, all
+# of them relative to the troposphere_support folder that is located only once
+_RESOURCES_PATHS = {
+    "tropospheric_coeff_path": "tropospheric_legendre_coefficients",
+    "grid_stations_fine": "gridpoint_coord_1x1.txt",
+    "grid_stations_coarse": "gridpoint_coord_5x5.txt",
+}
+_troposphere_support_path = None
+
+
+def _resource_path(name: str):
+    """Resolving the resource path associated to name, memoized into module globals so that next lookups do not go
+    through module __getattr__."""
+    global _troposphere_support_path
+
+    if name not in globals():
+        if _troposphere_support_path is None:
+            _troposphere_support_path = res.files(resources).joinpath("troposphere_support")
+        globals()[name] = _troposphere_support_path.joinpath(_RESOURCES_PATHS[name])
+    return globals()[name]
+
+
+def _read_legendre_table(coeff_path, key: str):
+    """Parsing a single tropospheric Legendre coefficients table from the resources folder, as a numpy array."""
+    import numpy as np
+
+    with coeff_path.joinpath(key + ".txt").open("r", encoding="UTF-8") as f_in:
+        return np.loadtxt(f_in, dtype=np.float64)
+
+
+def __getattr__(name: str):
+    """Lazy loading of module resources (PEP 562), files are located and read only when first requested."""
+    global _tropospheric_legendre_coeff
+
+    if name in _RESOURCES_PATHS:
+        return _resource_path(name)
+
+    if name == "tropospheric_legendre_coeff":
+        if _tropospheric_legendre_coeff is None:
+            # numpy is imported only when the coefficients are first requested, keeping package import lightweight
+            import numpy as np
+
+            coeff_path = _resource_path("tropospheric_coeff_path")
+            # all tables share the same shape: storing them in a single contiguous read-only block, each key being
+            # a view over it
+            coeff_block = np.stack([_read_legendre_table(coeff_path, key) for key in _TROPOSPHERIC_LEGENDRE_KEYS])
+            coeff_block.flags.writeable = False
+            _tropospheric_legendre_coeff = dict(zip(_TROPOSPHERIC_LEGENDRE_KEYS, coeff_block))
+        return _tropospheric_legendre_coeff
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,10 +8,10 @@ Atmospheric Delay Corrections: Ionospheric submodule
 Through the ionosphere, propagation delays are caused by dispersive effects.
 """
 
-import re
 import warnings
 from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -19,21 +19,30 @@ import numpy as np
 
 # import requests
 from arepytools.geometry.conversions import xyz2llh
-from arepytools.geometry.ellipsoid import (
-    Ellipsoid,
-    compute_line_ellipsoid_intersections,
-)
 from arepytools.geometry.geometric_functions import compute_incidence_angles
 from arepytools.io.metadata import PreciseDateTime
 from arepytools.timing.conversions import date_to_gps_week
-from more_itertools import pairwise
-from scipy.interpolate import RegularGridInterpolator
 
 from arepyextras.perturbations.atmospheric import GPS_WEEK_REFERENCE
 
 # constants
 DEFAULT_EARTH_RADIUS = 6371000.0  # [m]
 DEFAULT_IONOSPHERE_HEIGHT = 450000.0  # [m]
+DEFAULT_LAT_GRID = (87.5, -87.5, -2.5)  # [deg] LAT1 / LAT2 / DLAT
+DEFAULT_LON_GRID = (-180.0, 180.0, 5.0)  # [deg] LON1 / LON2 / DLON
+
+# IONEX record labels, located from column 61 onwards of each line
+_IONEX_LABELS = (
+    "HGT1 / HGT2 / DHGT",
+    "BASE RADIUS",
+    "EXPONENT",
+    "LAT1 / LAT2 / DLAT",
+    "LON1 / LON2 / DLON",
+    "START OF TEC MAP",
+    "END OF TEC MAP",
+    "EPOCH OF CURRENT MAP",
+    "LAT/LON1/LON2/DLON/H",
+)
 
 
 class IonosphericAnalysisCenters(Enum):
@@ -66,6 +75,10 @@ class IonosphericMapFileNotFoundError(FileNotFoundError):
     """Could not find the specified ionospheric map file"""
 
 
+class AcquisitionTimeOutOfMapsRangeError(ValueError):
+    """Acquisition time outside the time span covered by the ionospheric map file"""
+
+
 # custom enum classes
 class TECMappingFunctionIncidenceAngleMethod(Enum):
     """Method for generating mapping function for Ionospheric delay evaluation from TEC data"""
@@ -92,40 +105,179 @@ class TECMapTimeResolution(Enum):
 
 # custom support functions
 # angle between n-dimensional vectors
-def _angle_between_vectors(vector_1: np.ndarray, vector_2: np.ndarray) -> float:
-    """Evaluate the angle in radians between input n-dimensional vectors.
+def _angle_between_vectors(vector_1: np.ndarray, vector_2: np.ndarray) -> Union[float, np.ndarray]:
+    """Evaluate the angle in radians between input n-dimensional vectors. Batches of vectors are supported as well,
+    stacking them along the first axis, the angle being evaluated row by row.
 
     Parameters
     ----------
-    v1 : np.ndarray
-        first vector
-    v2 : np.ndarray
-        second vector
+    vector_1 : np.ndarray
+        first vector, shape (M,) or batch of vectors of shape (N, M)
+    vector_2 : np.ndarray
+        second vector, shape (M,) or batch of vectors of shape (N, M)
 
     Returns
     -------
-    float
-        angle between vectors in radians
+    Union[float, np.ndarray]
+        angle between vectors in radians, shape (N,) for batches of vectors
     """
 
-    def unit_vector(vector: np.ndarray) -> np.ndarray:
-        """Compute the unit vector (unit vector) of the input vector.
+    squared_norm_1 = np.einsum("...i,...i->...", vector_1, vector_1)
+    squared_norm_2 = np.einsum("...i,...i->...", vector_2, vector_2)
+    dot_product = np.einsum("...i,...i->...", vector_1, vector_2)
 
-        Parameters
-        ----------
-        vector : np.ndarray
-            vector
+    return np.arccos(np.clip(dot_product / np.sqrt(squared_norm_1 * squared_norm_2), -1.0, 1.0))
 
-        Returns
-        -------
-        np.ndarray
-            unit vector
-        """
-        return vector / np.linalg.norm(vector)
 
-    v1_u = unit_vector(vector_1)
-    v2_u = unit_vector(vector_2)
-    return np.arccos(np.clip(np.dot(v1_u, v2_u), -1.0, 1.0))
+# intersection between lines and a sphere centered in the origin
+def _ray_sphere_intersection(line_origins: np.ndarray, line_directions: np.ndarray, radius: float) -> np.ndarray:
+    """Closed form intersection between lines and a sphere centered in the origin, solving the quadratic equation
+    |origin + k * direction|^2 = radius^2 for each line. The first intersection found moving from the line origin
+    along its direction (k >= 0) is selected: the entry point for origins outside the sphere, the exit point for
+    origins inside it.
+
+    Parameters
+    ----------
+    line_origins : np.ndarray
+        origins of the lines, shape (N, 3)
+    line_directions : np.ndarray
+        directions of the lines, shape (N, 3)
+    radius : float
+        radius of the sphere
+
+    Returns
+    -------
+    np.ndarray
+        first intersection points along the line directions, shape (N, 3)
+
+    Raises
+    ------
+    ValueError
+        if any line does not intersect the sphere, or intersects it only behind its origin
+    """
+
+    a = np.einsum("...i,...i->...", line_directions, line_directions)
+    b = 2 * np.einsum("...i,...i->...", line_origins, line_directions)
+    c = np.einsum("...i,...i->...", line_origins, line_origins) - radius**2
+
+    discriminant = b * b - 4 * a * c
+    if np.any(discriminant < 0):
+        raise ValueError("Line of sight does not intersect the sphere")
+    sqrt_discriminant = np.sqrt(discriminant)
+
+    # nearest root along the line direction, the farthest one being selected when the nearest is behind the origin
+    k = (-b - sqrt_discriminant) / (2 * a)
+    behind_origin = k < 0
+    if np.any(behind_origin):
+        k = np.where(behind_origin, (-b + sqrt_discriminant) / (2 * a), k)
+        if np.any(k < 0):
+            raise ValueError("Line of sight intersects the sphere only behind its origin")
+
+    # intersection points are built in a single output buffer
+    intersections = np.multiply(line_directions, k[..., np.newaxis])
+    intersections += line_origins
+
+    return intersections
+
+
+# bilinear interpolation over the regular TEC maps grid
+def _bilinear_interpolation(
+    grid_values: np.ndarray,
+    lat_axis: np.ndarray,
+    lon_axis: np.ndarray,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """Bilinear interpolation of values defined over a regular latitude/longitude grid, for a stack of maps sharing
+    the same grid. Grid nodes are equally spaced along each axis, so the cell containing each point is found directly
+    from the axis origin and step.
+
+    Parameters
+    ----------
+    grid_values : np.ndarray
+        values on the grid nodes of M maps, shape (M, lat_axis.size, lon_axis.size)
+    lat_axis : np.ndarray
+        equally spaced, monotonically increasing latitude axis of the grid
+    lon_axis : np.ndarray
+        equally spaced, monotonically increasing longitude axis of the grid
+    lat : np.ndarray
+        latitude coordinates of the points to be interpolated, broadcastable to shape (M, N)
+    lon : np.ndarray
+        longitude coordinates of the points to be interpolated, broadcastable to shape (M, N)
+    out : np.ndarray, optional
+        float64 array of shape (M, N) where the interpolated values are written, a new one is allocated if None,
+        by default None
+
+    Returns
+    -------
+    np.ndarray
+        interpolated values of each map, shape (M, N), out if provided
+
+    Raises
+    ------
+    ValueError
+        if any point lies outside the grid or has NaN coordinates
+    """
+
+    # bounds are checked as in-grid conditions so that NaN coordinates are rejected as well
+    lat_in_grid = (lat >= lat_axis[0]) & (lat <= lat_axis[-1])
+    lon_in_grid = (lon >= lon_axis[0]) & (lon <= lon_axis[-1])
+    if not (np.all(lat_in_grid) and np.all(lon_in_grid)):
+        raise ValueError("One of the requested points is out of the latitude/longitude grid bounds")
+
+    # fractional index of each point along both axes, grid steps are inverted once for all the points; indexes are
+    # clipped only to absorb rounding of points lying on the grid boundaries
+    lat_index = np.subtract(lat, lat_axis[0])
+    lat_index *= 1.0 / (lat_axis[1] - lat_axis[0])
+    np.clip(lat_index, 0, lat_axis.size - 1, out=lat_index)
+    lon_index = np.subtract(lon, lon_axis[0])
+    lon_index *= 1.0 / (lon_axis[1] - lon_axis[0])
+    np.clip(lon_index, 0, lon_axis.size - 1, out=lon_index)
+
+    # lower corner of the grid cell and relative position of the point inside it
+    lat_id = np.minimum(lat_index.astype(int), lat_axis.size - 2)
+    lon_id = np.minimum(lon_index.astype(int), lon_axis.size - 2)
+    lat_weight = lat_index - lat_id
+    lon_weight = lon_index - lon_id
+
+    # each row of points is gathered from its own map
+    map_id = np.arange(grid_values.shape[0])[:, np.newaxis]
+
+    lat_weight_complement = 1 - lat_weight
+    lon_weight_complement = 1 - lon_weight
+
+    # accumulating the four corners contributions into the output buffer
+    out = np.multiply(grid_values[map_id, lat_id, lon_id], lat_weight_complement, out=out)
+    out *= lon_weight_complement
+    out += grid_values[map_id, lat_id + 1, lon_id] * lat_weight * lon_weight_complement
+    out += grid_values[map_id, lat_id, lon_id + 1] * lat_weight_complement * lon_weight
+    out += grid_values[map_id, lat_id + 1, lon_id + 1] * lat_weight * lon_weight
+
+    return out
+
+
+def _grid_axis(first: float, last: float, step: float) -> np.ndarray:
+    """Building a TEC map grid axis from its IONEX definition, first value, last value and step.
+
+    Parameters
+    ----------
+    first : float
+        first value of the axis, as stored in file
+    last : float
+        last value of the axis, as stored in file
+    step : float
+        axis step, negative if values are stored in decreasing order
+
+    Returns
+    -------
+    np.ndarray
+        monotonically increasing axis
+    """
+
+    num_nodes = int(round((last - first) / step)) + 1
+    axis = first + step * np.arange(num_nodes)
+    return axis if step > 0 else axis[::-1]
 
 
 # defining function to properly process the timestamp info
@@ -143,9 +295,9 @@ def _epoch_timestamp_formatter(timestamp: str) -> str:
         formatted timestamp
     """
 
-    digits = re.findall(r"[0-9]+", timestamp)
-    digits = [int(d) for d in digits]
-    formatted_timestamp = f"{digits[0]}-{digits[1]:02}-{digits[2]:02} {digits[3]:02}:{digits[4]:02}"
+    # epoch fields are whitespace separated integers: year, month, day, hour, minutes, seconds
+    year, month, day, hour, minutes = map(int, timestamp.split()[:5])
+    formatted_timestamp = f"{year}-{month:02}-{day:02} {hour:02}:{minutes:02}"
 
     return formatted_timestamp
 
@@ -185,25 +337,13 @@ def generate_ionospheric_map_filename(
     if gps_week < GPS_WEEK_REFERENCE:
         # composing the name of the map file BEFORE GPS Week 2237
         # name format YYYY/DDD/AAAgDDD#.YYi.Z
-        return center.name.lower() + f"g{acq_time.day_of_the_year:03}0.{(acq_time.year % 100):02}i"
+        return f"{center.name.lower()}g{acq_time.day_of_the_year:03}0.{(acq_time.year % 100):02}i"
 
     # format SINCE GPS Week 2238
-    # name format AAA0OPSTYP_YYYYDDDHHMM_01D_SMP_CNT.INX.gz
+    # name format AAA0OPSTYP_YYYYDDDHHMM_01D_SMP_CNT.INX.gz, hours and minutes always set to 0000
     return (
-        center.name
-        + "0OPS"
-        + solution_type.value
-        + "_"
-        + str(acq_time.year)
-        + f"{acq_time.day_of_the_year:03}"
-        # + f"{acq_time.hour_of_day:02}"
-        # + f"{acq_time.minute_of_hour:02}"
-        + "0000"
-        + "_01D"
-        + "_"
-        + time_resolution.value
-        + "_GIM"
-        + ".INX"
+        f"{center.name}0OPS{solution_type.value}_{acq_time.year}{acq_time.day_of_the_year:03}0000"
+        f"_01D_{time_resolution.value}_GIM.INX"
     )
 
 
@@ -283,37 +423,54 @@ class IonosphericDelayEstimator:
         if isinstance(analysis_center, IonosphericAnalysisCenters):
             self.analysis_center = analysis_center
         else:
-            try:
-                # if it's a string instead
-                self.analysis_center = IonosphericAnalysisCenters[analysis_center.upper()]
-            except KeyError as exc:
-                raise WrongAnalysisCenterNameError(
-                    f"{analysis_center} is not a supported CDDIS analysis center"
-                ) from exc
+            # if it's a string instead
+            self.analysis_center = IonosphericAnalysisCenters.__members__.get(analysis_center.upper())
+            if self.analysis_center is None:
+                raise WrongAnalysisCenterNameError(f"{analysis_center} is not a supported CDDIS analysis center")
 
         # map folder
-        self.ionospheric_map_folder = None
-        if isinstance(map_folder, Path):
-            self.ionospheric_map_folder = map_folder
-        elif isinstance(map_folder, str):
-            self.ionospheric_map_folder = Path(map_folder)
+        self.ionospheric_map_folder = Path(map_folder) if map_folder is not None else None
+
+    @staticmethod
+    def _scan_ionex_labels(content: list) -> dict[str, list[int]]:
+        """Scanning the IONEX file content once to locate the lines of each record of interest by their label.
+
+        Parameters
+        ----------
+        content : list
+            whole input file separated by lines
+
+        Returns
+        -------
+        dict[str, list[int]]
+            indexes of the lines matching each label in _IONEX_LABELS, in file order
+        """
+
+        labels_indexes = {label: [] for label in _IONEX_LABELS}
+        for index, line in enumerate(content):
+            label_indexes = labels_indexes.get(line[60:].strip())
+            if label_indexes is not None:
+                label_indexes.append(index)
+
+        return labels_indexes
 
     @staticmethod
-    def _tec_map_parsing(content: list, exponent_factor: float) -> tuple[list, list]:
+    def _tec_map_parsing(content: list, labels_indexes: dict[str, list[int]]) -> tuple[list, np.ndarray]:
         """Parsing TEC MAP file to isolate different sections and extract data and timestamps in usable format.
 
         Parameters
         ----------
         content : list
             whole input file separated by lines
-        exponent_factor : float
-            scaling exponent factor to be applied to the extracted TEC data (the scaling factor is 10^exponent)
+        labels_indexes : dict[str, list[int]]
+            indexes of the lines of each IONEX record label, as returned by _scan_ionex_labels
 
         Returns
         -------
-        tuple[list, list]
+        tuple[list, np.ndarray]
             list of timestamps for each tec map,
-            list of data arrays for each tec map
+            tec data of all maps as stored in file, not scaled by the exponent factor, array of shape
+            (number of maps, number of latitude bands, number of longitudes), bands in file order
 
         Raises
         ------
@@ -321,37 +478,50 @@ class IonosphericDelayEstimator:
             error in reading the TEC map sections of the IONEX map file
         """
 
-        # identifying the start of each tec map section
-        tec_start_id = [index for index, s in enumerate(content) if "START OF TEC MAP" in s]
-        # same for the end of each section
-        tec_end_id = [index for index, s in enumerate(content) if "END OF TEC MAP" in s]
+        # start and end of each tec map section
+        tec_start_id = labels_indexes["START OF TEC MAP"]
+        tec_end_id = labels_indexes["END OF TEC MAP"]
 
         # checking that start and end of section indexes are of the same length
         if not len(tec_start_id) == len(tec_end_id):
             raise TECMapReadingError("Could not isolate each TEC MAP section")
 
-        # combining indexes to define start and end of each section
-        tec_sections_boundaries = [(tec_start_id[index], tec_end_id[index]) for index in range(len(tec_start_id))]
-
-        # isolating each tec map section
-        tec_sections = [content[b[0] + 1 : b[1]] for b in tec_sections_boundaries]
-        tec_timestamps = [item for section in tec_sections for item in section if "EPOCH OF CURRENT MAP" in item]
-        # formatting timestamps
-        tec_timestamps = list(map(_epoch_timestamp_formatter, tec_timestamps))
-
-        tec_data = []
-        for section in tec_sections:
-            section_data = [line for line in section if "EPOCH OF CURRENT MAP" not in line]
-            # identifying the sub-sections of lat lon h, adding the last line to have a full boundary for segmentation
-            subsection_ids = [index for index, value in enumerate(section_data) if "LAT/LON1/LON2/DLON/H" in value]
-            subsection_ids.append(len(section_data))
-            # subsections segmentation + conversion to numpy array
-            data_subsections = [
-                np.fromstring("".join(section_data[indexes[0] + 1 : indexes[1]]), sep=" ")
-                for indexes in pairwise(subsection_ids)
-            ]
-            # multiplying whole data array by scaling exponential factor
-            tec_data.append(np.vstack(data_subsections) * 10**exponent_factor)
+        if not tec_start_id:
+            raise TECMapReadingError("No TEC MAP section found")
+
+        # epoch lines of the tec map sections
+        epoch_id = [
+            index
+            for index in labels_indexes["EPOCH OF CURRENT MAP"]
+            if any(start < index < end for start, end in zip(tec_start_id, tec_end_id))
+        ]
+        tec_timestamps = [_epoch_timestamp_formatter(content[index]) for index in epoch_id]
+
+        # each latitude band is introduced by its lat/lon/h header line, all the other lines except the epoch one are
+        # data: joining the data lines of all maps once to parse them in a single pass
+        band_id = np.asarray(labels_indexes["LAT/LON1/LON2/DLON/H"], dtype=int)
+        header_id = set(epoch_id).union(band_id.tolist())
+
+        band_counts = set()
+        line_counts = set()
+        data_lines = []
+        for start, end in zip(tec_start_id, tec_end_id):
+            map_lines = [content[index] for index in range(start + 1, end) if index not in header_id]
+            band_counts.add(int(np.count_nonzero((band_id > start) & (band_id < end))))
+            line_counts.add(len(map_lines))
+            data_lines.extend(map_lines)
+
+        # all maps must share the same layout
+        if len(band_counts) != 1 or len(line_counts) != 1:
+            raise TECMapReadingError("TEC MAP sections layout differs between maps")
+        num_bands = band_counts.pop()
+
+        values = np.fromstring(" ".join(data_lines), sep=" ")
+        if num_bands == 0 or values.size % (len(tec_start_id) * num_bands) != 0:
+            raise TECMapReadingError("Could not read TEC MAP sections")
+
+        # file values are integers, exactly represented in single precision
+        tec_data = values.reshape(len(tec_start_id), num_bands, -1).astype(np.float32)
 
         return tec_timestamps, tec_data
 
@@ -361,7 +531,7 @@ class IonosphericDelayEstimator:
         pt_coords: np.ndarray,
         earth_radius: float = DEFAULT_EARTH_RADIUS,
         ionosphere_height: float = DEFAULT_IONOSPHERE_HEIGHT,
-    ) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Detecting ionospheric pierce points (IPP) for each line of sight sensor/point-target.
 
         Parameters
@@ -377,30 +547,23 @@ class IonosphericDelayEstimator:
 
         Returns
         -------
-        tuple[np.ndarray, np.ndarray, list[np.ndarray]]
+        tuple[np.ndarray, np.ndarray, np.ndarray]
             latitude coordinates of pierce points [deg],
             longitude coordinates of pierce points [deg],
-            list of ionospheric pierce points xyz coordinates
+            ionospheric pierce points xyz coordinates, shape (N, 3)
         """
 
-        # defining ionosphere ellipsoid
-        ionosphere_radius = earth_radius + ionosphere_height
-        ionosphere = Ellipsoid(first_semi_axis=ionosphere_radius, second_semi_axis=ionosphere_radius)
-
-        line_of_sight = pt_coords - sat_coords
-
-        #  finding intersection between line of sight and the ellipsoid
-        intersections = compute_line_ellipsoid_intersections(
-            ellipsoid=ionosphere, line_origins=sat_coords, line_directions=line_of_sight
+        # finding the intersection between line of sight and the ionosphere sphere closest to the satellite
+        ipp_xyz = _ray_sphere_intersection(
+            line_origins=sat_coords, line_directions=pt_coords - sat_coords, radius=earth_radius + ionosphere_height
         )
 
-        # taking just the first intersection solutions for each point and converting to lat/lon [deg]
-        ipp_xyz = [p[0] for p in intersections]
-        ipp_llh = [xyz2llh(p) for p in ipp_xyz]
-        ipp_lat_deg = np.concatenate([np.rad2deg(c[0]) for c in ipp_llh])
-        ipp_long_deg = np.concatenate([np.rad2deg(c[1]) for c in ipp_llh])
+        # converting to lat/lon [deg] all at once
+        ipp_llh = xyz2llh(ipp_xyz.T)
+        ipp_lat_deg = np.rad2deg(ipp_llh[0])
+        ipp_long_deg = np.rad2deg(ipp_llh[1])
 
-        return ipp_lat_deg, ipp_long_deg, np.vstack(ipp_xyz)
+        return ipp_lat_deg, ipp_long_deg, ipp_xyz
 
     @staticmethod
     def _generate_mapping_function(
@@ -409,6 +572,7 @@ class IonosphericDelayEstimator:
         ionosphere_height: float = DEFAULT_IONOSPHERE_HEIGHT,
         ipp_coords: np.ndarray = None,
         pt_coords: np.ndarray = None,
+        earth_radius: float = DEFAULT_EARTH_RADIUS,
     ) -> np.ndarray:
         """Generating a mapping function based on incidence angle using the selected method. Mapping function is needed
         for conversion into slant delay using the zenith angle.
@@ -430,6 +594,8 @@ class IonosphericDelayEstimator:
             ionosphere pierce point coordinates in XYZ format, by default None
         pt_coords : np.ndarray, optional
             point targets coordinates in XYZ format, by default None
+        earth_radius : float, optional
+            earth radius, by default DEFAULT_EARTH_RADIUS
 
         Returns
         -------
@@ -438,87 +604,225 @@ class IonosphericDelayEstimator:
         """
 
         if method == TECMappingFunctionIncidenceAngleMethod.IPP:
-            diff_sat_ipp = sat_coords - ipp_coords
-            zenith_angles = [
-                _angle_between_vectors(ipp_coords[p, :], diff_sat_ipp[p, :]) for p in range(ipp_coords.shape[0])
-            ]
+            zenith_angles = _angle_between_vectors(ipp_coords, sat_coords - ipp_coords)
             mapping_function = 1 / np.cos(zenith_angles)
         elif method == TECMappingFunctionIncidenceAngleMethod.GROUND:
             incidence_angle = compute_incidence_angles(sat_coords, pt_coords)
             mapping_function = 1 / np.cos(incidence_angle)
         elif method == TECMappingFunctionIncidenceAngleMethod.GROUND_CONVERTED:
-            incidence_angle = compute_incidence_angles(sat_coords, pt_coords)
-            mapping_function = 1 / np.sqrt(
-                1 - (DEFAULT_EARTH_RADIUS / (DEFAULT_EARTH_RADIUS + ionosphere_height) * np.sin(incidence_angle)) ** 2
-            )
+            radius_ratio = earth_radius / (earth_radius + ionosphere_height)
+            mapping_function = np.sin(compute_incidence_angles(sat_coords, pt_coords))
+            mapping_function *= radius_ratio
+            mapping_function *= mapping_function
+            mapping_function = 1 / np.sqrt(1 - mapping_function)
 
         return mapping_function
 
-    def read_ionosphere_map_file(self, ionosphere_map_file: Path) -> tuple[list, list, np.ndarray, np.ndarray]:
-        """Read the Ionosphere IONEX map file to extract data on Total Electron Content.
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _parse_ionosphere_map_file(
+        ionosphere_map_file: Path, modification_time_ns: int
+    ) -> tuple[
+        np.ndarray, float, PreciseDateTime, np.ndarray, Union[float, None], Union[float, None], np.ndarray, np.ndarray
+    ]:
+        """Parsing the Ionosphere IONEX map file. Results are cached and reused as long as the same file, with the
+        same modification time, is requested again.
 
         Parameters
         ----------
         ionosphere_map_file : Path
             path to the ionosphere map file, not zipped
+        modification_time_ns : int
+            modification time of the file in nanoseconds, part of the cache key only
 
         Returns
         -------
-        tuple[list, list, np.ndarray, np.ndarray]
-            list of tec data arrays for each lat/lon,
-            list of recording hours,
+        tuple[
+            np.ndarray, float, PreciseDateTime, np.ndarray, Union[float, None], Union[float, None], np.ndarray, np.ndarray
+        ]
+            read-only tec data of all maps as stored in file, shape (number of maps, number of latitudes, number of
+            longitudes), latitude and longitude ordered as monotonically increasing axes,
+            scaling factor converting tec data to TEC units (10^exponent),
+            recording time of the first map,
+            read-only recording times of each map, as seconds from the first one,
+            ionosphere height [m], None if it could not be read from file,
+            earth radius [m], None if it could not be read from file,
+            read-only latitude axis (monotonically increasing),
+            read-only longitude axis (monotonically increasing)
+
+        Raises
+        ------
+        TECMapReadingError
+            TEC maps size not matching the grid defined in the file header
+        """
+
+        with open(ionosphere_map_file, "r", encoding="UTF-8") as f_in:
+            file_content = f_in.read().splitlines()
+
+        # locating all the records of interest with a single scan of the file
+        labels_indexes = IonosphericDelayEstimator._scan_ionex_labels(file_content)
+
+        def _first_record_value(label: str) -> float:
+            return float(file_content[labels_indexes[label][0]].split()[0])
+
+        # extracting ionosphere height from map file
+        try:
+            ionosphere_height = _first_record_value("HGT1 / HGT2 / DHGT") * 1000
+        except Exception:
+            ionosphere_height = None
+
+        # extracting earth radius from map file
+        try:
+            earth_radius = _first_record_value("BASE RADIUS") * 1000
+        except Exception:
+            earth_radius = None
+
+        # extracting data exponent factor from file
+        tec_scaling_factor = 10 ** _first_record_value("EXPONENT")
+
+        # extracting grid definition from file, the standard global grid is assumed if not available
+        def _grid_record(label: str, default_grid: tuple[float, float, float]) -> tuple[float, float, float]:
+            try:
+                first, last, step = (float(v) for v in file_content[labels_indexes[label][0]][:60].split())
+            except Exception:
+                return default_grid
+            return first, last, step
+
+        lat_first, lat_last, lat_step = _grid_record("LAT1 / LAT2 / DLAT", DEFAULT_LAT_GRID)
+        lon_first, lon_last, lon_step = _grid_record("LON1 / LON2 / DLON", DEFAULT_LON_GRID)
+
+        # parsing the file to isolate TEC map data
+        timestamps, tec_data = IonosphericDelayEstimator._tec_map_parsing(
+            content=file_content, labels_indexes=labels_indexes
+        )
+        # recording times are kept as seconds elapsed from the first map
+        timestamps = [datetime.fromisoformat(t) for t in timestamps]
+        reference_epoch = PreciseDateTime.from_numeric_datetime(
+            year=timestamps[0].year,
+            month=timestamps[0].month,
+            day=timestamps[0].day,
+            hours=timestamps[0].hour,
+            minutes=timestamps[0].minute,
+        )
+        epoch_offsets = np.array([(t - timestamps[0]).total_seconds() for t in timestamps])
+        epoch_offsets.flags.writeable = False
+
+        # latitude and longitude axes must be monotonically increasing (required by interpolation): reordering data
+        # stored in decreasing order
+        lat_axis = _grid_axis(lat_first, lat_last, lat_step)
+        lon_axis = _grid_axis(lon_first, lon_last, lon_step)
+        if tec_data.shape[1:] != (lat_axis.size, lon_axis.size):
+            raise TECMapReadingError(
+                f"TEC MAP size {tec_data.shape[1:]} does not match the grid size {(lat_axis.size, lon_axis.size)}"
+            )
+        if lat_step < 0:
+            tec_data = tec_data[:, ::-1]
+        if lon_step < 0:
+            tec_data = tec_data[:, :, ::-1]
+        tec_data = np.ascontiguousarray(tec_data)
+
+        # cached data are shared between calls
+        for array in (tec_data, lat_axis, lon_axis):
+            array.flags.writeable = False
+
+        return (
+            tec_data,
+            tec_scaling_factor,
+            reference_epoch,
+            epoch_offsets,
+            ionosphere_height,
+            earth_radius,
+            lat_axis,
+            lon_axis,
+        )
+
+    def _load_ionosphere_map_file(
+        self, ionosphere_map_file: Path
+    ) -> tuple[np.ndarray, float, PreciseDateTime, np.ndarray, np.ndarray, np.ndarray]:
+        """Loading the Ionosphere IONEX map file content through the parsing cache, updating ionosphere height and
+        earth radius with the values read from file.
+
+        Parameters
+        ----------
+        ionosphere_map_file : Path
+            path to the ionosphere map file, not zipped
+
+        Returns
+        -------
+        tuple[np.ndarray, float, PreciseDateTime, np.ndarray, np.ndarray, np.ndarray]
+            read-only tec data of all maps as stored in file, shape (number of maps, number of latitudes, number of
+            longitudes), latitude and longitude ordered as monotonically increasing axes,
+            scaling factor converting tec data to TEC units,
+            recording time of the first map,
+            recording times of each map, as seconds from the first one,
             latitude axis (monotonically increasing),
             longitude axis (monotonically increasing)
         """
 
-        # reading file
-        if ionosphere_map_file.is_file():
-            # if file is not compressed
-            with open(ionosphere_map_file, "r", encoding="UTF-8") as f_in:
-                # Read file removing header section
-                file_content = f_in.read().splitlines()
-        else:
+        if not ionosphere_map_file.is_file():
             raise IonosphericMapFileNotFoundError(
                 f"{ionosphere_map_file} file not found in specified folder {str(ionosphere_map_file.parent)}"
             )
 
-        # extracting ionosphere height from map file
-        try:
-            # overwriting default value set by init
-            self._ionosphere_height = [float(f.strip().split()[0]) for f in file_content if "HGT1" in f][0] * 1000
-        except Exception:
+        (
+            tec_data,
+            tec_scaling_factor,
+            reference_epoch,
+            epoch_offsets,
+            ionosphere_height,
+            earth_radius,
+            tec_map_lat_axis,
+            tec_map_lon_axis,
+        ) = self._parse_ionosphere_map_file(ionosphere_map_file.resolve(), ionosphere_map_file.stat().st_mtime_ns)
+
+        # overwriting default values set by init
+        if ionosphere_height is not None:
+            self._ionosphere_height = ionosphere_height
+        else:
             warnings.warn(
                 "Error while trying to extract Ionospheric Height from map data, "
                 + f"using default value {DEFAULT_IONOSPHERE_HEIGHT} [m]"
             )
-
-        # extracting earth radius from map file
-        try:
-            # overwriting default value set by init
-            self._earth_radius = [float(f.strip().split()[0]) for f in file_content if "BASE RADIUS" in f][0] * 1000
-        except Exception:
+        if earth_radius is not None:
+            self._earth_radius = earth_radius
+        else:
             warnings.warn(
                 "Error while trying to extract Earth Radius from map data, "
                 + f"using default value {DEFAULT_EARTH_RADIUS} [m]"
             )
 
-        # extracting data exponent factor from file
-        tec_scaling_exponent = [float(f.strip().split()[0]) for f in file_content if "EXPONENT" in f][0]
+        return tec_data, tec_scaling_factor, reference_epoch, epoch_offsets, tec_map_lat_axis, tec_map_lon_axis
 
-        # parsing the file to isolate TEC map data
-        timestamps, tec_data = self._tec_map_parsing(content=file_content, exponent_factor=tec_scaling_exponent)
-        timestamps = [datetime.strptime(t, "%Y-%m-%d %H:%M") for t in timestamps]
-        timestamps = [PreciseDateTime.fromisoformat(t.isoformat()) for t in timestamps]
+    def read_ionosphere_map_file(self, ionosphere_map_file: Path) -> tuple[list, list, np.ndarray, np.ndarray]:
+        """Read the Ionosphere IONEX map file to extract data on Total Electron Content.
+
+        Parsed file content is cached, so reading again the same unchanged file does not access it twice.
+
+        Parameters
+        ----------
+        ionosphere_map_file : Path
+            path to the ionosphere map file, not zipped
 
-        # Make latitude and longitude axis, must be monotonically increasing (required by interpolator)
-        tec_map_lat_axis = np.arange(-87.5, (87.5 + 1), 2.5)
-        tec_map_lon_axis = np.arange(-180, 180 + 1, 5)
+        Returns
+        -------
+        tuple[list, list, np.ndarray, np.ndarray]
+            list of tec data arrays for each lat/lon,
+            list of recording hours,
+            latitude axis (monotonically increasing),
+            longitude axis (monotonically increasing)
+        """
 
-        # changing order of rows in each tec array due to the mismatch between the latitude axis herein built and the
-        # one in the loaded file
-        tec_data = [np.flip(item, axis=0) for item in tec_data]
+        (
+            tec_data,
+            tec_scaling_factor,
+            reference_epoch,
+            epoch_offsets,
+            tec_map_lat_axis,
+            tec_map_lon_axis,
+        ) = self._load_ionosphere_map_file(ionosphere_map_file)
+        timestamps = [reference_epoch + offset for offset in epoch_offsets.tolist()]
 
-        return tec_data, timestamps, tec_map_lat_axis, tec_map_lon_axis
+        return list(tec_data.astype(np.float64) * tec_scaling_factor), timestamps, tec_map_lat_axis, tec_map_lon_axis
 
     def estimate_delay(self, sat_xyz_coords: np.ndarray, point_targets_coords: np.ndarray) -> np.ndarray:
         """Estimation of the ionospheric time delay as first order approximation of the ionospheric path delay in
@@ -536,16 +840,26 @@ class IonosphericDelayEstimator:
         Parameters
         ----------
         sat_xyz_coords : np.ndarray
-            satellite XYZ coordinates at which calibration targets are seen as numpy array of shape Nx3
+            satellite XYZ coordinates at which calibration targets are seen as numpy array of shape Nx3, or of shape
+            (3,) for a single target
         point_targets_coords : np.ndarray
-            point targets XYZ coordinates as numpy array of shape Nx3
+            point targets XYZ coordinates as numpy array of shape Nx3, or of shape (3,) for a single target
 
         Returns
         -------
         np.ndarray
-            ionospheric delay
+            ionospheric delay, shape (N,), shape (1,) for a single target
+
+        Raises
+        ------
+        AcquisitionTimeOutOfMapsRangeError
+            if the acquisition time is outside the time span covered by the maps in file
         """
 
+        # targets are always processed as a batch of shape Nx3
+        sat_xyz_coords = np.atleast_2d(sat_xyz_coords)
+        point_targets_coords = np.atleast_2d(point_targets_coords)
+
         # building the ionospheric map filename
         ionospheric_map_filename = generate_ionospheric_map_filename(
             acq_time=self.acquisition_time,
@@ -557,16 +871,22 @@ class IonosphericDelayEstimator:
         path_to_file = self.ionospheric_map_folder.joinpath(ionospheric_map_filename)
 
         # reading ionospheric map data
-        tec_data, timestamps, lat_axis, lon_axis = self.read_ionosphere_map_file(path_to_file)
-
-        # find the recording timestamps closest to the acquisition time
-        closest_timestamp_id = np.argmin([abs(self.acquisition_time - t) for t in timestamps])
-        if timestamps[closest_timestamp_id] - self.acquisition_time > 0:
-            # if the acquisition time is above the half of the hour, i.e. 11:37:00.00, the closest timestamp
-            # of the map file would be the next hour. Subtracting 1 to avoid this issue
-            closest_timestamp_id -= 1
+        tec_data, tec_scaling_factor, reference_epoch, epoch_offsets, lat_axis, lon_axis = (
+            self._load_ionosphere_map_file(path_to_file)
+        )
+
+        # find the last recording timestamp not after the acquisition time, timestamps being sorted in increasing
+        # order: the acquisition time falls between it and the next one, i.e. 11:37:00.00 -> 11:00:00.00 and
+        # 12:00:00.00. Acquisition times outside the maps time span are rejected, the index is clipped only to pair
+        # an acquisition time exactly at the last map epoch with the previous map
+        acquisition_offset = self.acquisition_time - reference_epoch
+        if not epoch_offsets[0] <= acquisition_offset <= epoch_offsets[-1]:
+            raise AcquisitionTimeOutOfMapsRangeError(
+                f"acquisition time {self.acquisition_time} is outside the time span covered by maps in {path_to_file}"
+            )
+        closest_timestamp_id = np.searchsorted(epoch_offsets, acquisition_offset, side="right")
+        closest_timestamp_id = int(np.clip(closest_timestamp_id - 1, 0, epoch_offsets.size - 2))
         # taking the closest value and the next one for interpolation purposes
-        timestamps_selected = timestamps[closest_timestamp_id : closest_timestamp_id + 2]
         tec_data_selected = tec_data[closest_timestamp_id : closest_timestamp_id + 2]
 
         # find ionospheric pierce point
@@ -577,24 +897,23 @@ class IonosphericDelayEstimator:
             ionosphere_height=self._ionosphere_height,
         )
 
-        # calculating longitude accounting for Earth rotation
-        # NOTE this will probably give wrong results for points close to either +-180 longitudes
-        time_deltas = np.array([(t - self.acquisition_time) / 3600 for t in timestamps_selected])
-        ipp_long_selected = [ipp_longitude_deg + 360.0 / 24.0 * t for t in time_deltas]
+        # calculating longitude accounting for Earth rotation, wrapped back to [-180, 180) degrees
+        time_deltas = (epoch_offsets[closest_timestamp_id : closest_timestamp_id + 2] - acquisition_offset) / 3600
+        ipp_long_selected = ipp_longitude_deg + 360.0 / 24.0 * time_deltas[:, np.newaxis]
+        ipp_long_selected += 180.0
+        ipp_long_selected %= 360.0
+        ipp_long_selected -= 180.0
 
-        # tec grid interpolation
-        interpolating_functions = [RegularGridInterpolator((lat_axis, lon_axis), tec) for tec in tec_data_selected]
-        # bilinear interpolation over latitude and longitude
-        interpolated_values1 = interpolating_functions[0]((ipp_latitude_deg, ipp_long_selected[0]))
-        interpolated_values2 = interpolating_functions[1]((ipp_latitude_deg, ipp_long_selected[1]))
+        # tec grid bilinear interpolation over latitude and longitude, both selected maps at once
+        interpolated_values = _bilinear_interpolation(
+            tec_data_selected, lat_axis, lon_axis, ipp_latitude_deg, ipp_long_selected
+        )
 
-        # linear interpolation in time
+        # linear interpolation in time, reusing the first interpolated values buffer
         t_diff = time_deltas[1] - time_deltas[0]
-        tec_interpolated = [
-            np.abs(time_deltas[1]) / t_diff * interpolated_values1,
-            np.abs(time_deltas[0]) / t_diff * interpolated_values2,
-        ]
-        tec_interpolated = np.add(tec_interpolated[0], tec_interpolated[1])
+        tec_interpolated = interpolated_values[0]
+        tec_interpolated *= np.abs(time_deltas[1]) / t_diff
+        tec_interpolated += np.abs(time_deltas[0]) / t_diff * interpolated_values[1]
 
         # generating mapping function
         mapping_function = self._generate_mapping_function(
@@ -603,16 +922,14 @@ class IonosphericDelayEstimator:
             method=self.tec_mapping_method,
             ionosphere_height=self._ionosphere_height,
             pt_coords=point_targets_coords,
+            earth_radius=self._earth_radius,
         )
 
         # computing the ionospheric delay
         # first order approximation of the ionospheric path delay in slant range
-        ionospheric_delay = (
-            (40.3 * 1e16 / self.carrier_freq**2)
-            * tec_interpolated
-            * mapping_function
-            * self.ionospheric_delay_scaling_factor
-        )
+        # tec data scaling to TEC units is applied here, on the interpolated values only
+        delay_factor = 40.3 * 1e16 / self.carrier_freq**2 * self.ionospheric_delay_scaling_factor * tec_scaling_factor
+        ionospheric_delay = delay_factor * tec_interpolated * mapping_function
 
         return ionospheric_delay
 
@@ -637,9 +954,10 @@ def compute_delay(
     acq_time : PreciseDateTime
         scene acquisition time, the time at which the ionospheric delay must be evaluated
     targets_xyz_coords : np.ndarray
-        point targets XYZ coordinates as numpy array of shape Nx3
+        point targets XYZ coordinates as numpy array of shape Nx3, or of shape (3,) for a single target
     sat_xyz_coords : np.ndarray
-        satellite XYZ coordinates at which calibration targets are seen as numpy array of shape Nx3
+        satellite XYZ coordinates at which calibration targets are seen as numpy array of shape Nx3, or of shape (3,)
+        for a single target
     analysis_center : Union[str, IonosphericAnalysisCenters]
         analysis center for solutions from those supported
     fc_hz : float
@@ -658,7 +976,7 @@ def compute_delay(
     Returns
     -------
     np.ndarray
-        ionospheric delay
+        ionospheric delay, shape (N,), shape (1,) for a single target
     """
 
     # instantiating class
@@ -14,9 +14,8 @@ On the contrary, the air water vapor varies both vertically and laterally over s
 """
 
 import re
-from datetime import datetime
 from enum import Enum, auto
-from io import BytesIO, StringIO
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -26,13 +25,15 @@ from arepytools.geometry.conversions import xyz2llh
 from arepytools.geometry.geometric_functions import compute_incidence_angles
 from arepytools.io.metadata import PreciseDateTime
 from arepytools.timing.conversions import date_to_gps_week
-from scipy.interpolate import griddata, interp1d
-
-from arepyextras.perturbations import (
-    grid_stations_coarse,
-    grid_stations_fine,
-    tropospheric_legendre_coeff,
+from scipy.interpolate import (
+    CloughTocher2DInterpolator,
+    LinearNDInterpolator,
+    NearestNDInterpolator,
+    interp1d,
 )
+
+import arepyextras.perturbations as perturbations
+from arepyextras.perturbations import grid_stations_coarse, grid_stations_fine
 from arepyextras.perturbations.atmospheric import GPS_WEEK_REFERENCE
 
 # constants definition
@@ -45,6 +46,12 @@ GRAVITATIONAL_ACCELERATION = 9.80665  # [m/s^2]
 MOLAR_MASS_AIR = 0.0289644  # [kg/mol]
 UNIVERSAL_GAS_CONSTANT = 8.3144598  # [J/mol/K]
 SAASTAMOINEN_CNTS = (0.0022768, 0.00266, 0.28e-6)
+# barometric formula exponent, data independent
+_BAROMETRIC_EXPONENT = (
+    GRAVITATIONAL_ACCELERATION * MOLAR_MASS_AIR / UNIVERSAL_GAS_CONSTANT / TROPOSPHERE_TEMP_LAPSE_RATE
+)
+# empirical mapping function coefficients expanded in spherical harmonics
+_MAPPING_FUNCTION_COEFF_KEYS = ("bh", "bw", "ch", "cw")
 
 
 # custom errors
@@ -107,8 +114,116 @@ class TroposphericGridInterpolationMethod(Enum):
 
 
 # custom support functions
+# tropospheric Legendre coefficients tables
+@lru_cache(maxsize=None)
+def _legendre_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Stacking the tropospheric Legendre coefficients tables of each mapping function coefficient, in the order of
+    _MAPPING_FUNCTION_COEFF_KEYS. Resources are loaded on first call only and reused afterwards.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        read-only "anm" coefficients tables, shape (4, 91, 5),
+        read-only "bnm" coefficients tables, shape (4, 91, 5)
+    """
+
+    legendre_coeff = perturbations.tropospheric_legendre_coeff
+    anm_tables = np.stack([legendre_coeff["anm_" + key] for key in _MAPPING_FUNCTION_COEFF_KEYS])
+    bnm_tables = np.stack([legendre_coeff["bnm_" + key] for key in _MAPPING_FUNCTION_COEFF_KEYS])
+    anm_tables.flags.writeable = False
+    bnm_tables.flags.writeable = False
+
+    return anm_tables, bnm_tables
+
+
+# spherical harmonics Legendre functions
+def _legendre_functions(
+    x_uv: Union[float, np.ndarray],
+    y_uv: Union[float, np.ndarray],
+    z_uv: Union[float, np.ndarray],
+    poly_order: int = 12,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculating the Lagrange spherical harmonics polynomial arrays up to order and degree poly_order, by default
+    12. Arrays of unit vectors components are supported as well, evaluating the polynomials for each of them.
+
+    Sectoral terms (degree equal to order) are evaluated first, then the recurrence along the degree is applied to all
+    the orders of each degree at once.
+
+    Parameters
+    ----------
+    x_uv : Union[float, np.ndarray]
+        x unit vector, scalar or array of shape (N,)
+    y_uv : Union[float, np.ndarray]
+        y unit vector, scalar or array of shape (N,)
+    z_uv : Union[float, np.ndarray]
+        z unit vector, scalar or array of shape (N,)
+    poly_order : int, optional
+        order and degree of polynomial, by default 12
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Legendre polynomial arrays indexed by [degree, order], of shape (poly_order + 1, poly_order + 1) followed by
+        the shape of the inputs
+    """
+
+    points_shape = np.broadcast(x_uv, y_uv, z_uv).shape
+    v_func = np.zeros((poly_order + 1, poly_order + 1) + points_shape)
+    w_func = np.zeros((poly_order + 1, poly_order + 1) + points_shape)
+    v_func[0, 0] = 1
+
+    # sectoral terms and the first term below each of them
+    for num in range(poly_order):
+        v_func[num + 1, num + 1] = (2 * num + 1) * (x_uv * v_func[num, num] - y_uv * w_func[num, num])
+        w_func[num + 1, num + 1] = (2 * num + 1) * (x_uv * w_func[num, num] + y_uv * v_func[num, num])
+        v_func[num + 1, num] = (2 * num + 1) * z_uv * v_func[num, num]
+        w_func[num + 1, num] = (2 * num + 1) * z_uv * w_func[num, num]
+
+    # recurrence along the degree, for all the orders lower than the degree at once
+    orders = np.arange(poly_order).reshape((-1,) + (1,) * len(points_shape))
+    for num in range(1, poly_order):
+        order = orders[:num]
+        v_func[num + 1, :num] = ((2 * num + 1) * z_uv * v_func[num, :num] - (num + order) * v_func[num - 1, :num]) / (
+            num - order + 1
+        )
+        w_func[num + 1, :num] = ((2 * num + 1) * z_uv * w_func[num, :num] - (num + order) * w_func[num - 1, :num]) / (
+            num - order + 1
+        )
+
+    return v_func, w_func
+
+
+# scattered data interpolation
+def _grid_interpolator(
+    grid_points: np.ndarray, values: np.ndarray, method: TroposphericGridInterpolationMethod
+) -> Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]:
+    """Building the same interpolator used by scipy griddata for the selected method, so that it can be evaluated for
+    several arrays of values at once sharing a single triangulation (or KD-tree, for nearest neighbour) of the grid.
+
+    Parameters
+    ----------
+    grid_points : np.ndarray
+        grid points coordinates, shape (M, 2)
+    values : np.ndarray
+        values associated to each grid point, shape (M,) or (M, K) for K distinct arrays of values
+    method : TroposphericGridInterpolationMethod
+        type of interpolation (linear, cubic, nearest)
+
+    Returns
+    -------
+    Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]
+        interpolator returning values of shape (N,) or (N, K) when evaluated at N points
+    """
+
+    if method == TroposphericGridInterpolationMethod.NEAREST:
+        return NearestNDInterpolator(grid_points, values)
+    if method == TroposphericGridInterpolationMethod.LINEAR:
+        return LinearNDInterpolator(grid_points, values)
+    return CloughTocher2DInterpolator(grid_points, values)
+
+
 # barometric formula
-def _troposphere_barometric_formula(height: float) -> float:
+def _troposphere_barometric_formula(height: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Computing the barometric formula (pressure variation with altitude) for the troposphere ISA level.
 
     Implemented formula (latex):
@@ -122,18 +237,17 @@ def _troposphere_barometric_formula(height: float) -> float:
 
     Parameters
     ----------
-    height : float
-        height from sea level
+    height : Union[float, np.ndarray]
+        height from sea level, scalar or array
 
     Returns
     -------
-    float
-        pressure at that height
+    Union[float, np.ndarray]
+        pressure at that height, same shape of height
     """
 
-    exponent = GRAVITATIONAL_ACCELERATION * MOLAR_MASS_AIR / UNIVERSAL_GAS_CONSTANT / TROPOSPHERE_TEMP_LAPSE_RATE
-    pressure = (
-        ATMOSPHERIC_PRESSURE_MB * (1 - TROPOSPHERE_TEMP_LAPSE_RATE / TROPOSPHERE_TEMP_REFERENCE * height) ** exponent
+    pressure = ATMOSPHERIC_PRESSURE_MB * np.power(
+        1 - TROPOSPHERE_TEMP_LAPSE_RATE / TROPOSPHERE_TEMP_REFERENCE * height, _BAROMETRIC_EXPONENT
     )
 
     return pressure
@@ -170,24 +284,20 @@ def generate_tropospheric_map_name_for_vmf_data(
         list of file dates in PreciseDatetime form
     """
 
-    base_name = map_type.name + "_"
-
     # finding the base date corresponding to the acquisition time of interest
     acq_base_date_components = [
         acq_time.year,
         acq_time.month,
         acq_time.day_of_the_month,
     ]
-    acq_base_date = PreciseDateTime.fromisoformat(
-        datetime.strptime("-".join([str(t) for t in acq_base_date_components]), "%Y-%m-%d").isoformat()
-    )
+    acq_base_date = PreciseDateTime.from_numeric_datetime(*acq_base_date_components)
     # determine the previous and next days
     prev_date = acq_base_date - SECONDS_IN_A_DAY
     next_date = acq_base_date + SECONDS_IN_A_DAY
 
-    # looping over indexes to select proper files based on which is the closest one to the acquisition date
+    # selecting proper files based on which is the closest one to the acquisition date, recorded every 6 hours
     time_ids = [0, 6, 12, 18]
-    closest_recorded_hour_id = np.where([acq_time.hour_of_day >= t for t in time_ids])[0][-1]
+    closest_recorded_hour_id = int(acq_time.hour_of_day) // 6
     closest_acquisition = acq_base_date_components.copy()
     closest_acquisition.append(time_ids[closest_recorded_hour_id])
 
@@ -221,14 +331,10 @@ def generate_tropospheric_map_name_for_vmf_data(
         # if also the next recording is the day after
         next_acquisition = [next_date.year, next_date.month, next_date.day_of_the_month, time_ids[next_date_id]]
 
-    # assembling filenames
-    file_names = [
-        base_name + f"{t[0]}" + f"{t[1]:02}" + f"{t[2]:02}" + f".H{t[3]:02}"
-        for t in [previous_acquisition, closest_acquisition, next_acquisition, next2_acquisition]
-    ]
-    times = [previous_acquisition, closest_acquisition, next_acquisition, next2_acquisition]
-    times = [[str(t) for t in lst] for lst in times]
-    times = [PreciseDateTime.fromisoformat(datetime.strptime("-".join(t), "%Y-%m-%d-%H").isoformat()) for t in times]
+    # assembling filenames and dates, [year, month, day, hour] for each file
+    acquisitions = [previous_acquisition, closest_acquisition, next_acquisition, next2_acquisition]
+    file_names = [f"{map_type.name}_{t[0]}{t[1]:02}{t[2]:02}.H{t[3]:02}" for t in acquisitions]
+    times = [PreciseDateTime.from_numeric_datetime(*t) for t in acquisitions]
 
     return file_names, times
 
@@ -343,31 +449,137 @@ class TroposphericDelayEstimator:
             selected grid resolution not implemented
         """
 
-        # loading data from file
-        col_names = ["point", "lat", "lon", "ellipsoidal_height_m", "orthometric_height_m"]
+        grid_file, modification_time_ns = self._locate_station_file(grid=grid, search_input_fldr=search_input_fldr)
+
+        # each caller gets its own copy of the cached data
+        return self._parse_station_file(grid_file, modification_time_ns).copy()
+
+    def _locate_station_file(
+        self, grid: TroposphericGRIDResolution, search_input_fldr: bool = False
+    ) -> tuple[Path, Union[int, None]]:
+        """Locating the grid points station coordinates file, in this module resources or in the input map directory
+        depending on the search_input_fldr flag.
+
+        Parameters
+        ----------
+        grid : TroposphericGRIDResolution
+            grid resolution enum
+        search_input_fldr : bool, optional
+            if this flag is True, the files are searched in the input map directory provided at init, by default False
+
+        Returns
+        -------
+        tuple[Path, Union[int, None]]
+            path to the grid points station coordinates file, or package resource,
+            modification time of the file in nanoseconds, None for package resources
+
+        Raises
+        ------
+        TroposphericGridStationFileNotFoundError
+            grid points station coordinates file not found in input folder
+        GridResolutionNotSupportedError
+            selected grid resolution not implemented
+        """
+
         if search_input_fldr:
             # if files should be loaded from given folder path
-            file = self.tropospheric_map_folder.joinpath("gridpoint_coord_" + grid.value).with_suffix(".txt")
-            if file.is_file():
-                with open(file, mode="rb") as f_in:
-                    content = f_in.read()
-                    clean_file = re.sub(b" +", b";", content)
-            else:
-                raise TroposphericGridStationFileNotFoundError(f"{str(file)} not found")
+            grid_file = self.tropospheric_map_folder.joinpath("gridpoint_coord_" + grid.value).with_suffix(".txt")
+            if not grid_file.is_file():
+                raise TroposphericGridStationFileNotFoundError(f"{str(grid_file)} not found")
+            modification_time_ns = grid_file.stat().st_mtime_ns
         else:
             # if files are default ones, stored in this module resources
             if grid == TroposphericGRIDResolution.FINE:
-                grid_file = grid_stations_fine.read_bytes()
-                clean_file = re.sub(b" +", b";", grid_file)
+                grid_file = grid_stations_fine
             elif grid == TroposphericGRIDResolution.COARSE:
-                grid_file = grid_stations_coarse.read_bytes()
-                clean_file = re.sub(b" +", b";", grid_file)
+                grid_file = grid_stations_coarse
             else:
                 raise TroposphericGridResolutionNotSupportedError(f"{grid} not supported")
+            # package resources never change
+            modification_time_ns = None
+
+        return grid_file, modification_time_ns
+
+    def _load_station_heights_interpolator(
+        self, grid: TroposphericGRIDResolution, search_input_fldr: bool = False
+    ) -> Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]:
+        """Loading the interpolator of the ellipsoidal heights of the grid points stations, built with the interpolation
+        method selected at init. Using default station files in this module resources if not explicitly specified by
+        the search_input_fldr flag.
+
+        Parameters
+        ----------
+        grid : TroposphericGRIDResolution
+            grid resolution enum
+        search_input_fldr : bool, optional
+            if this flag is True, the files are searched in the input map directory provided at init, by default False
+
+        Returns
+        -------
+        Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]
+            interpolator of the stations ellipsoidal heights, to be evaluated at (lon, lat) points in degrees
+        """
+
+        grid_file, modification_time_ns = self._locate_station_file(grid=grid, search_input_fldr=search_input_fldr)
+        return self._build_station_heights_interpolator(grid_file, modification_time_ns, self.interp_method)
+
+    @staticmethod
+    @lru_cache(maxsize=6)
+    def _build_station_heights_interpolator(
+        grid_file: Path, modification_time_ns: Union[int, None], method: TroposphericGridInterpolationMethod
+    ) -> Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]:
+        """Building the interpolator of the grid points stations ellipsoidal heights. The station grid does not change
+        between calls, so the interpolator (and its triangulation) is cached and reused as long as the same file,
+        with the same modification time, is requested again with the same method.
+
+        Parameters
+        ----------
+        grid_file : Path
+            path to the grid points station coordinates file, or package resource
+        modification_time_ns : Union[int, None]
+            modification time of the file in nanoseconds, part of the cache key only, None for package resources
+        method : TroposphericGridInterpolationMethod
+            type of interpolation (linear, cubic, nearest)
+
+        Returns
+        -------
+        Union[NearestNDInterpolator, LinearNDInterpolator, CloughTocher2DInterpolator]
+            interpolator of the stations ellipsoidal heights, shared between calls
+        """
+
+        grid_point_station = TroposphericDelayEstimator._parse_station_file(grid_file, modification_time_ns)
+        return _grid_interpolator(
+            grid_point_station[["lon", "lat"]].to_numpy(),
+            grid_point_station["ellipsoidal_height_m"].to_numpy(),
+            method,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _parse_station_file(grid_file: Path, modification_time_ns: Union[int, None]) -> pd.DataFrame:
+        """Parsing a grid points station coordinates file. Results are cached and reused as long as the same file,
+        with the same modification time, is requested again.
 
-        # converting data to pandas dataframe
-        grid_data = pd.read_csv(BytesIO(clean_file), sep=";", comment="%", header=None, names=col_names)
-        grid_data.drop(columns=["point"], inplace=True)
+        Parameters
+        ----------
+        grid_file : Path
+            path to the grid points station coordinates file, or package resource
+        modification_time_ns : Union[int, None]
+            modification time of the file in nanoseconds, part of the cache key only, None for package resources
+
+        Returns
+        -------
+        pd.DataFrame
+            pandas dataframe containing the grid point station coordinates, shared between calls
+        """
+
+        # converting data to pandas dataframe, whitespace separated columns are parsed directly by the C engine and
+        # the point name column is skipped while reading
+        col_names = ["point", "lat", "lon", "ellipsoidal_height_m", "orthometric_height_m"]
+        with grid_file.open("rb") as f_in:
+            grid_data = pd.read_csv(
+                f_in, sep=r"\s+", comment="%", header=None, names=col_names, usecols=col_names[1:], dtype=np.float64
+            )
 
         # shifting longitude axes ([0,360]->[-180,180])
         grid_data.loc[grid_data["lon"] > 180, "lon"] -= 360
@@ -376,56 +588,33 @@ class TroposphericDelayEstimator:
 
     @staticmethod
     def _generate_lagrange_polynomials(
-        x_uv: float, y_uv: float, z_uv: float, poly_order: int = 12
+        x_uv: Union[float, np.ndarray],
+        y_uv: Union[float, np.ndarray],
+        z_uv: Union[float, np.ndarray],
+        poly_order: int = 12,
     ) -> tuple[np.ndarray, np.ndarray]:
         """Calculating the Lagrange spherical harmonics polynomial arrays up to order and degree poly_order, by default
-        12.
+        12. Arrays of unit vectors components are supported as well, evaluating the polynomials for each of them.
+
+        See _legendre_functions.
 
         Parameters
         ----------
-        x_uv : float
-            x unit vector
-        y_uv : float
-            y unit vector
-        z_uv : float
-            z unit vector
+        x_uv : Union[float, np.ndarray]
+            x unit vector, scalar or array of shape (N,)
+        y_uv : Union[float, np.ndarray]
+            y unit vector, scalar or array of shape (N,)
+        z_uv : Union[float, np.ndarray]
+            z unit vector, scalar or array of shape (N,)
         poly_order : int, optional
             order and degree of polynomial, by default 12
 
         Returns
         -------
         tuple[np.ndarray, np.ndarray]
-            Legendre polynomial arrays
+            Legendre polynomial arrays, of shape (poly_order + 1, poly_order + 1) followed by the shape of the inputs
         """
-
-        v_func = np.zeros((poly_order + 1, poly_order + 1))
-        w_func = np.zeros((poly_order + 1, poly_order + 1))
-        v_func[0, 0] = 1
-        w_func[0, 0] = 0
-        v_func[1, 0] = z_uv * v_func[0, 0]
-        w_func[1, 0] = 0
-
-        # populating lagrange spherical harmonics polynomials arrays
-        for num in range(1, poly_order):
-            v_func[num + 1, 0] = ((2 * num + 1) * z_uv * v_func[num, 0] - (num) * v_func[num - 1, 0]) / (num + 1)
-            w_func[num + 1, 0] = 0
-
-        for num in range(poly_order):
-            v_func[num + 1, num + 1] = (2 * num + 1) * (x_uv * v_func[num, num] - y_uv * w_func[num, num])
-            w_func[num + 1, num + 1] = (2 * num + 1) * (x_uv * w_func[num, num] + y_uv * v_func[num, num])
-            if num < poly_order - 1:
-                v_func[num + 2, num + 1] = (2 * num + 3) * z_uv * v_func[num + 1, num + 1]
-                w_func[num + 2, num + 1] = (2 * num + 3) * z_uv * w_func[num + 1, num + 1]
-
-            for num_ in range(num + 2, poly_order):
-                v_func[num_ + 1, num + 1] = (
-                    (2 * num_ + 1) * z_uv * v_func[num_, num + 1] - (num_ + num + 1) * v_func[num_ - 1, num + 1]
-                ) / (num_ - num)
-                w_func[num_ + 1, num + 1] = (
-                    (2 * num_ + 1) * z_uv * w_func[num_, num + 1] - (num_ + num + 1) * w_func[num_ - 1, num + 1]
-                ) / (num_ - num)
-
-        return v_func, w_func
+        return _legendre_functions(x_uv=x_uv, y_uv=y_uv, z_uv=z_uv, poly_order=poly_order)
 
     def _generate_mapping_function(
         self,
@@ -437,7 +626,7 @@ class TroposphericDelayEstimator:
         a_w: np.ndarray,
     ) -> dict:
         """Generating the wet and hydrostatic mapping functions to estimate the zenith delay. This computation is
-        performed for each value in the input arrays separately in case of multiple point targets to be analyzed.
+        performed for all the point targets at once, each value in the input arrays being a distinct point target.
 
         python-implementation and refinement of matlab script from
         (c) Department of Geodesy and Geoinformation, Vienna University of Technology, 2016
@@ -476,10 +665,8 @@ class TroposphericDelayEstimator:
             dictionary with keys 'hydrostatic' and 'wet' for both mapping functions evaluated for each point target
         """
 
-        # loading Legendre polynomials for bh, bw, ch, cw coefficients
-        tropospheric_legendre_coeff_loaded = dict.fromkeys(tropospheric_legendre_coeff.keys())
-        for key, value in tropospheric_legendre_coeff.items():
-            tropospheric_legendre_coeff_loaded[key] = pd.read_csv(BytesIO(value), sep=" ", header=None).to_numpy()
+        # Legendre polynomials coefficients tables for bh, bw, ch, cw coefficients
+        anm_tables, bnm_tables = _legendre_tables()
 
         # computing unit vectors
         distance_from_pole = np.pi / 2 - lat
@@ -490,53 +677,35 @@ class TroposphericDelayEstimator:
         # compute Legendre polynomials
         poly_order = 12  # should not be changed
 
-        # evaluating the mapping functions for each point target
-        mapping_functions = {"wet": [], "hydrostatic": []}
-        for point in range(lat.size):
-            v_func, w_func = self._generate_lagrange_polynomials(x_uv=x_uv[point], y_uv=y_uv[point], z_uv=z_uv[point])
-
-            epsilon = np.pi / 2 - incidence_angle[point]
-
-            coeff = {}
-            coeff["bh"] = [0, 0, 0, 0, 0]
-            coeff["bw"] = [0, 0, 0, 0, 0]
-            coeff["ch"] = [0, 0, 0, 0, 0]
-            coeff["cw"] = [0, 0, 0, 0, 0]
-            for num in range(poly_order + 1):
-                cumulative_idx = sum(range(num + 1))
-                for key, value in coeff.items():
-                    for num_ in range(len(value)):
-                        coeff[key][num_] += np.sum(
-                            tropospheric_legendre_coeff_loaded["anm_" + key][
-                                cumulative_idx : cumulative_idx + num + 1, num_
-                            ]
-                            * v_func[num, : num + 1]
-                            + tropospheric_legendre_coeff_loaded["bnm_" + key][
-                                cumulative_idx : cumulative_idx + num + 1, num_
-                            ]
-                            * w_func[num, : num + 1]
-                        )
-
-            # adding the seasonal amplitudes for the specified day of the year to the mean values
-            doy_ratio_rad = acq_time.day_of_the_year / DAYS_IN_YEAR * 2 * np.pi
-            for key, value in coeff.items():
-                coeff[key] = (
-                    value[0]
-                    + value[1] * np.cos(doy_ratio_rad)
-                    + value[2] * np.sin(doy_ratio_rad)
-                    + value[3] * np.cos(doy_ratio_rad * 2)
-                    + value[4] * np.sin(doy_ratio_rad * 2)
-                )
-
-            # computing the mapping functions
-            mfh = (1 + (a_h[point] / (1 + coeff["bh"] / (1 + coeff["ch"])))) / (
-                np.sin(epsilon) + (a_h[point] / (np.sin(epsilon) + coeff["bh"] / (np.sin(epsilon) + coeff["ch"])))
-            )
-            mfw = (1 + (a_w[point] / (1 + coeff["bw"] / (1 + coeff["cw"])))) / (
-                np.sin(epsilon) + (a_w[point] / (np.sin(epsilon) + coeff["bw"] / (np.sin(epsilon) + coeff["cw"])))
-            )
-            mapping_functions["wet"].append(mfw)
-            mapping_functions["hydrostatic"].append(mfh)
+        # evaluating the mapping functions for all point targets, polynomials having the point targets as last axis
+        v_func, w_func = self._generate_lagrange_polynomials(x_uv=x_uv, y_uv=y_uv, z_uv=z_uv, poly_order=poly_order)
+
+        epsilon = np.pi / 2 - incidence_angle
+
+        # coefficients tables rows follow the lower triangular (degree, order) terms of the polynomials, degree first:
+        # all the spherical harmonics sums (mean value and seasonal amplitudes) are evaluated at once
+        degree_id, order_id = np.tril_indices(poly_order + 1)
+        coeff = np.einsum("kic,in->kcn", anm_tables, v_func[degree_id, order_id]) + np.einsum(
+            "kic,in->kcn", bnm_tables, w_func[degree_id, order_id]
+        )
+
+        # adding the seasonal amplitudes for the specified day of the year to the mean values, annual and semi-annual
+        # terms share the same trigonometric evaluation (double-angle identities)
+        doy_ratio_rad = acq_time.day_of_the_year / DAYS_IN_YEAR * 2 * np.pi
+        cos_doy = np.cos(doy_ratio_rad)
+        sin_doy = np.sin(doy_ratio_rad)
+        seasonal_terms = np.array([1, cos_doy, sin_doy, 2 * cos_doy**2 - 1, 2 * sin_doy * cos_doy])
+        coeff = dict(zip(_MAPPING_FUNCTION_COEFF_KEYS, np.einsum("c,kcn->kn", seasonal_terms, coeff)))
+
+        # computing the mapping functions
+        sin_epsilon = np.sin(epsilon)
+        mfh = (1 + (a_h / (1 + coeff["bh"] / (1 + coeff["ch"])))) / (
+            sin_epsilon + (a_h / (sin_epsilon + coeff["bh"] / (sin_epsilon + coeff["ch"])))
+        )
+        mfw = (1 + (a_w / (1 + coeff["bw"] / (1 + coeff["cw"])))) / (
+            sin_epsilon + (a_w / (sin_epsilon + coeff["bw"] / (sin_epsilon + coeff["cw"])))
+        )
+        mapping_functions = {"wet": mfw, "hydrostatic": mfh}
 
         return mapping_functions
 
@@ -545,7 +714,8 @@ class TroposphericDelayEstimator:
         data: list[pd.DataFrame], lat_bound: tuple[float, float], lon_bound: tuple[float, float]
     ) -> list[pd.DataFrame]:
         """Filtering input dataframes by latitude and longitude based on the provided boundaries to select only rows
-        whit lat/lon inside those intervals.
+        whit lat/lon inside those intervals. All the dataframes are expected to share the same lat/lon grid, the
+        selection mask is evaluated on the first one and applied to all of them.
 
         Parameters
         ----------
@@ -562,13 +732,11 @@ class TroposphericDelayEstimator:
             same list of input but with filtered dataframes
         """
 
-        filtered_data = []
-        for df_ in data:
-            filtered_data.append(
-                df_.query("lat < @lat_bound[0] & lat > @lat_bound[1] & lon < @lon_bound[0] & lon > @lon_bound[1]")
-            )
+        lat = data[0]["lat"].to_numpy()
+        lon = data[0]["lon"].to_numpy()
+        mask = (lat < lat_bound[0]) & (lat > lat_bound[1]) & (lon < lon_bound[0]) & (lon > lon_bound[1])
 
-        return filtered_data
+        return [df_[mask] for df_ in data]
 
     @staticmethod
     def _interpolating_lat_lon(
@@ -605,12 +773,68 @@ class TroposphericDelayEstimator:
         # points at which to interpolate data
         points_to_be_interpolated = np.vstack((lon[1], lat[1])).T
 
-        interp_space_values = [griddata(grid_points, v, points_to_be_interpolated, method.name.lower()) for v in values]
+        # all the values share the same grid, a single interpolator is built for them
+        interpolator = _grid_interpolator(grid_points, np.stack(values, axis=-1), method)
+        interp_space_values = list(interpolator(points_to_be_interpolated).T)
 
         return interp_space_values
 
     @staticmethod
-    def read_vmf3_files(files: list[Path]) -> list[pd.DataFrame]:
+    @lru_cache(maxsize=4)
+    def _parse_vmf3_file(
+        file: Path, modification_time_ns: int, usecols: Union[tuple[str, ...], None] = None
+    ) -> pd.DataFrame:
+        """Parsing a single VMF3 OP GRID troposphere data file. Results are cached and reused as long as the same file,
+        with the same modification time, is requested again. The cache holds at most the 4 epochs needed by a single
+        delay estimation: each global 1°x1° grid takes some MB of memory and is kept alive until evicted.
+
+        Parameters
+        ----------
+        file : Path
+            path to the file
+        modification_time_ns : int
+            modification time of the file in nanoseconds, part of the cache key only
+        usecols : Union[tuple[str, ...], None], optional
+            names of the columns to be loaded, all the columns if None, by default None
+
+        Returns
+        -------
+        pd.DataFrame
+            pandas dataframe from loaded file, shared between calls
+        """
+
+        # getting column names from header [lines starting with !], reading the file only up to that record
+        col_names = None
+        with open(file, mode="r", encoding="UTF-8") as f_in:
+            for line in f_in:
+                if "Data_types" in line:
+                    col_names = re.search(r"\((.*)\)", line).group(1).split()
+                    break
+
+        # reading data as whitespace separated csv from the memory mapped file, header lines are skipped as
+        # comments by the C parser
+        data = pd.read_csv(
+            file,
+            names=col_names,
+            header=None,
+            sep=r"\s+",
+            comment="!",
+            usecols=usecols,
+            dtype=np.float64,
+            memory_map=True,
+            encoding="UTF-8",
+        )
+
+        # shifting longitude axes ([0,360]->[-180,180])
+        if "lon" in data:
+            data.loc[data["lon"] > 180, "lon"] -= 360
+
+        return data
+
+    @staticmethod
+    def read_vmf3_files(
+        files: list[Path], usecols: Union[list[str], None] = None, copy: bool = True
+    ) -> list[pd.DataFrame]:
         """Reading VMF3 OP GRID troposphere data files. VMF3 files are provided as tabular textual data, with an header.
         Data are divided in the following columns:
         lat: latitude in deg,
@@ -620,10 +844,19 @@ class TroposphericDelayEstimator:
         zhd: zenith hydrostatic delay in meters,
         zwd: zenith wet delay in meters
 
+        Parsed files content is cached (up to 4 files), so reading again the same unchanged files does not access them
+        twice.
+
         Parameters
         ----------
         files : list[Path]
             list of path to files
+        usecols : Union[list[str], None], optional
+            names of the columns to be loaded, the others are skipped while parsing, all the columns if None,
+            by default None
+        copy : bool, optional
+            if True, each dataframe is a copy of the cached data that can be safely modified, if False the cached
+            dataframes are returned as they are and must not be modified in place, by default True
 
         Returns
         -------
@@ -631,29 +864,12 @@ class TroposphericDelayEstimator:
             list of pandas dataframe from loaded files
         """
 
-        # read troposphere VMF3 map file
+        # read troposphere VMF3 map file, copying the cached data if requested
+        usecols = tuple(usecols) if usecols is not None else None
         data = []
-        for file in files:
-            with open(file, mode="rb") as f_in:
-                # reading the file in binary format
-                lines = f_in.read().splitlines()
-                # separating header from the body [lines starting with !]
-                header = [l for l in lines if b"!" in l]
-                body = [l.decode("UTF-8").lstrip().rstrip() for l in lines if l not in header]
-                body = [re.sub(" +", ";", b) for b in body]
-                header = [l.decode("UTF-8") for l in header]
-
-            # getting column names from header
-            col_names = [h for h in header if "Data_types" in h][0]
-            col_names = re.findall("\(.*\)", col_names)[0].replace("(", "").replace(")", "").split()
-
-            # reading data as csv from loaded lines
-            data_ = pd.read_csv(StringIO("\n".join(body)), names=col_names, header=None, sep=";")
-
-            # shifting longitude axes ([0,360]->[-180,180])
-            data_.loc[data_["lon"] > 180, "lon"] -= 360
-
-            data.append(data_)
+        for file in map(Path, files):
+            file_data = TroposphericDelayEstimator._parse_vmf3_file(file.resolve(), file.stat().st_mtime_ns, usecols)
+            data.append(file_data.copy() if copy else file_data)
 
         return data
 
@@ -705,15 +921,15 @@ class TroposphericDelayEstimator:
             filepaths = [self.tropospheric_map_folder.joinpath(f) for f in files]
 
         if self.map_type == TroposphericMapType.VMF3:
-            data_list = self.read_vmf3_files(files=filepaths)
+            # cached data are only filtered into new dataframes, no copy needed
+            data_list = self.read_vmf3_files(files=filepaths, copy=False)
         else:
             raise RuntimeError("Files different from VMF3 are not supported")
 
         # point target coordinates conversion
-        llh_coordinates = xyz2llh(point_targets_coords.T).T
-        lat = np.rad2deg(llh_coordinates[:, 0])
-        lon = np.rad2deg(llh_coordinates[:, 1])
-        height = llh_coordinates[:, 2]  # targets height above ellipsoid
+        lat_rad, lon_rad, height = xyz2llh(point_targets_coords.T)  # height: targets height above ellipsoid
+        lat = np.rad2deg(lat_rad)
+        lon = np.rad2deg(lon_rad)
 
         # filtering dataframes lat and lon around point target area
         filtered_data = self._filtering_df_lat_lon(
@@ -723,53 +939,38 @@ class TroposphericDelayEstimator:
         )
 
         # defining axes for data interpolation along latitude, longitude and time
-        lat_axis = np.vstack([item["lat"].to_numpy() for item in filtered_data])
-        lon_axis = np.vstack([item["lon"].to_numpy() for item in filtered_data])
-        # checking that latitude values in each filtered dataset are equal
-        assert np.isclose(lat_axis, lat_axis[0]).all() & np.isclose(lon_axis, lon_axis[0]).all()
-        lat_axis = lat_axis[0]
-        lon_axis = lon_axis[0]
+        lat_axis = filtered_data[0]["lat"].to_numpy()
+        lon_axis = filtered_data[0]["lon"].to_numpy()
+        # checking that latitude and longitude values in each filtered dataset are equal
+        for item in filtered_data[1:]:
+            assert np.allclose(item["lat"].to_numpy(), lat_axis) and np.allclose(item["lon"].to_numpy(), lon_axis)
         # time axis
-        time_axis_s = np.array([t - time_dates[0] for t in time_dates])
+        time_axis_s = np.fromiter((t - time_dates[0] for t in time_dates), dtype=np.float64, count=len(time_dates))
         acq_time_rel_s = self.acquisition_time - time_dates[0]
 
-        interpolated_values = [
+        # interpolated values by map and value, array of shape (n, 4, m) where n is the number of timestamps (aka number
+        # of map files processed), 4 are the tropospheric data (ah, aw, zhd, zwd) and m is the number of point targets
+        # analyzed; all maps share the same grid, so they are interpolated together over a single triangulation
+        interp_values = np.reshape(
             self._interpolating_lat_lon(
                 lat=(lat_axis, lat),
                 lon=(lon_axis, lon),
-                values=(
-                    df["ah"].to_numpy(),
-                    df["aw"].to_numpy(),
-                    df["zhd"].to_numpy(),
-                    df["zwd"].to_numpy(),
-                ),
+                values=tuple(df[key].to_numpy() for df in filtered_data for key in ("ah", "aw", "zhd", "zwd")),
                 method=self.interp_method,
-            )
-            for df in filtered_data
-        ]
+            ),
+            (len(filtered_data), 4, lat.size),
+        )
 
-        # rearranging interpolated values by map and value
-        # each array in this list belongs to a distinct tropospheric data (ah, aw, zhd, zwd)
-        # each array is of shape (n, m) where n is the number of timestamps (aka number of map files processed) while
-        # m is the number of point targets analyzed
-        interp_values = [np.vstack([t[i] for t in interpolated_values]) for i in range(len(interpolated_values))]
-        interp_troposphere_values = []
-        for t_value in interp_values:
-            interp_troposphere_values.append(
-                np.array(
-                    [
-                        interp1d(time_axis_s, t_value[:, i], self.interp_method.name.lower())(acq_time_rel_s)
-                        for i in range(lat.size)
-                    ]
-                )
-            )
-        ah_interp, aw_interp, zhd_interp, zwd_interp = interp_troposphere_values
+        # interpolating all of them along time at once
+        ah_interp, aw_interp, zhd_interp, zwd_interp = interp1d(
+            time_axis_s, interp_values, self.interp_method.name.lower(), axis=0, assume_sorted=True
+        )(acq_time_rel_s)
 
         # building mapping factors from coefficients and spherical armonics
         incidence_angles = compute_incidence_angles(sat_xyz_coords, point_targets_coords)
         mapping_factors = self._generate_mapping_function(
-            lat=np.radians(lat),
-            lon=np.radians(lon),
+            lat=lat_rad,
+            lon=lon_rad,
             acq_time=self.acquisition_time,
             incidence_angle=incidence_angles,
             a_h=ah_interp,
@@ -777,47 +978,41 @@ class TroposphericDelayEstimator:
         )
 
         # correcting delay for delta altitude between troposphere data recording station and point target
-        # loading the station grid coordinates file
-        grid_point_station = self._load_station_altitudes(grid=self.map_grid_res, search_input_fldr=False)
+        # loading the station grid coordinates heights interpolator, built once for each station grid and method
+        station_heights_interpolator = self._load_station_heights_interpolator(
+            grid=self.map_grid_res, search_input_fldr=False
+        )
 
         # interpolate lat and lon values to get the right ellipsoidal height value for the point targets
         # height of elevation model (ETOPO5) at target location [m]
-        point_target_heights_gridpoint_interp = griddata(
-            grid_point_station[["lon", "lat"]].to_numpy(),
-            grid_point_station["ellipsoidal_height_m"].to_numpy(),
-            np.vstack((lon, lat)).T,
-            self.interp_method.name.lower(),
-        )
+        point_target_heights_gridpoint_interp = station_heights_interpolator(np.column_stack((lon, lat)))
+
+        # latitude dependent term shared by both Saastamoinen formulas
+        cos_two_lat = np.cos(2 * lat_rad)
+        saast_c0, saast_c1, saast_c2 = SAASTAMOINEN_CNTS
 
         # retrieving atmospheric pressure at point target location from the interpolated zenith hydrostatic delay
         # (inverse relationship) of Saastamoinen formula
 
         # evaluating pressure at point target elevation model (ETOPO5) heights [mbar]
-        pressure_at_point_targets_interp = (
-            zhd_interp
-            / SAASTAMOINEN_CNTS[0]
-            * (
-                1
-                - SAASTAMOINEN_CNTS[1] * np.cos(2 * np.radians(lat))
-                - SAASTAMOINEN_CNTS[2] * point_target_heights_gridpoint_interp
-            )
+        pressure_at_point_target_height = (
+            zhd_interp / saast_c0 * (1 - saast_c1 * cos_two_lat - saast_c2 * point_target_heights_gridpoint_interp)
         )
 
-        # determining delta pressure between point target height and the height interpolated on grid points
-        delta_p = _troposphere_barometric_formula(height) - _troposphere_barometric_formula(
-            point_target_heights_gridpoint_interp
-        )
-        pressure_at_point_target_height = pressure_at_point_targets_interp + delta_p
+        # adding delta pressure between point target height and the height interpolated on grid points, both
+        # pressures being evaluated with a single barometric formula call
+        pressure_at_heights = _troposphere_barometric_formula(np.stack((height, point_target_heights_gridpoint_interp)))
+        pressure_at_point_target_height += pressure_at_heights[0] - pressure_at_heights[1]
 
         # correcting the zenith delays by height variation
         # hydrostatic delay using the Saastamoinen formula
-        zenith_delay_h = (
-            SAASTAMOINEN_CNTS[0]
-            * pressure_at_point_target_height
-            / (1 - SAASTAMOINEN_CNTS[1] * np.cos(2 * np.radians(lat)) - SAASTAMOINEN_CNTS[2] * height)
-        )
+        zenith_delay_h = np.multiply(saast_c0, pressure_at_point_target_height, out=pressure_at_heights[0])
+        zenith_delay_h /= 1 - saast_c1 * cos_two_lat - saast_c2 * height
         # wet delay using the exponential factor formula
-        zenith_delay_w = zwd_interp * np.exp(-(height - point_target_heights_gridpoint_interp) / 2000.0)
+        zenith_delay_w = np.subtract(height, point_target_heights_gridpoint_interp, out=pressure_at_heights[1])
+        zenith_delay_w /= -2000.0
+        np.exp(zenith_delay_w, out=zenith_delay_w)
+        zenith_delay_w *= zwd_interp
 
         # compute tropospheric path delays in slant range [m]
         tropospheric_delay_hydrostatic = zenith_delay_h * mapping_factors["hydrostatic"]
@@ -13,6 +13,9 @@ from typing import Union
 
 import numpy as np
 
+# rotation poles unit conversion factor [milliarcsec/yr -> rad/s]
+_MILLIARCSEC_PER_YEAR_TO_RAD_PER_SECOND = (1 / 1000 * 1 / 3600 * np.pi / 180) / (3600 * 24 * 365.25)
+
 
 # custom errors
 class WrongTectonicPlateReferenceError(ValueError):
@@ -36,6 +39,17 @@ class ITRF2014PlatesRotationPoles(Enum):
     SOMA = [-0.121, -0.794, 0.884]
 
 
+def _rotation_pole_rad_per_second(plate: ITRF2014PlatesRotationPoles) -> np.ndarray:
+    """Converting plate rotation pole to a read-only array in [rad/s]."""
+    rotation_pole = np.array(plate.value) * _MILLIARCSEC_PER_YEAR_TO_RAD_PER_SECOND
+    rotation_pole.flags.writeable = False
+    return rotation_pole
+
+
+# ITRF2014-PMM rotation poles in [rad/s], built once at import time
+_ITRF2014_POLES_RAD_S = {plate.name: _rotation_pole_rad_per_second(plate) for plate in ITRF2014PlatesRotationPoles}
+
+
 def compute_displacement(
     xyz_coords: np.ndarray,
     time_delta: float,
@@ -75,21 +89,24 @@ def compute_displacement(
 
     if isinstance(plate_ref, str):
         try:
-            rotation_poles = np.array(ITRF2014PlatesRotationPoles[plate_ref.upper()].value)
+            rotation_poles = _ITRF2014_POLES_RAD_S[plate_ref.upper()]
         except KeyError as exc:
             raise WrongTectonicPlateReferenceError(f"Plate {plate_ref} is not defined") from exc
 
     elif isinstance(plate_ref, ITRF2014PlatesRotationPoles):
-        rotation_poles = np.array(plate_ref.value)
+        rotation_poles = _ITRF2014_POLES_RAD_S[plate_ref.name]
 
     if drift_vel is not None:
         # using input drift velocities to compute the displacement
         return drift_vel * time_delta
 
-    # converting rotation poles [milliarcsec/yr -> rad/s]
-    rotation_poles *= (1 / 1000 * 1 / 3600 * np.pi / 180) / (3600 * 24 * 365.25)
-
-    # compute displacement velocity
-    displacement_velocity = np.cross(rotation_poles, xyz_coords)
+    # scaling rotation poles [rad/s] by the time delta, so that their cross product with the coordinates directly
+    # gives the displacement
+    rot_x, rot_y, rot_z = rotation_poles * time_delta
 
-    return displacement_velocity * time_delta
+    # compute displacement as cross product between scaled rotation poles and coordinates
+    x_coord, y_coord, z_coord = xyz_coords[..., 0], xyz_coords[..., 1], xyz_coords[..., 2]
+    return np.stack(
+        (rot_y * z_coord - rot_z * y_coord, rot_z * x_coord - rot_x * z_coord, rot_x * y_coord - rot_y * x_coord),
+        axis=-1,
+    )
@@ -40,26 +40,23 @@ def _compute_displacement_unit_vectors(lat_geo_rad: np.ndarray, lon_rad: np.ndar
     # third dimension is the number of components of each unit vector (x, y, z)
     displacement_unit_vectors = np.zeros(shape=(3, lat_geo_rad.size, 3))
 
+    # trigonometric functions evaluated only once
+    sin_lat, cos_lat = np.sin(lat_geo_rad), np.cos(lat_geo_rad)
+    sin_lon, cos_lon = np.sin(lon_rad), np.cos(lon_rad)
+
     # north unit vector
-    displacement_unit_vectors[0] = np.array(
-        [
-            -np.sin(lat_geo_rad) * np.cos(lon_rad),
-            -np.sin(lat_geo_rad) * np.sin(lon_rad),
-            np.cos(lat_geo_rad),
-        ]
-    ).T
+    np.multiply(-sin_lat, cos_lon, out=displacement_unit_vectors[0, :, 0])
+    np.multiply(-sin_lat, sin_lon, out=displacement_unit_vectors[0, :, 1])
+    displacement_unit_vectors[0, :, 2] = cos_lat
 
-    # east unit vector
-    displacement_unit_vectors[1] = np.array([-np.sin(lon_rad), np.cos(lon_rad), np.zeros_like(lon_rad)]).T
+    # east unit vector (z component left to zero)
+    np.negative(sin_lon, out=displacement_unit_vectors[1, :, 0])
+    displacement_unit_vectors[1, :, 1] = cos_lon
 
     # up unit vector
-    displacement_unit_vectors[2] = np.array(
-        [
-            np.cos(lat_geo_rad) * np.cos(lon_rad),
-            np.cos(lat_geo_rad) * np.sin(lon_rad),
-            np.sin(lat_geo_rad),
-        ]
-    ).T
+    np.multiply(cos_lat, cos_lon, out=displacement_unit_vectors[2, :, 0])
+    np.multiply(cos_lat, sin_lon, out=displacement_unit_vectors[2, :, 1])
+    displacement_unit_vectors[2, :, 2] = sin_lat
 
     return displacement_unit_vectors
 
@@ -89,22 +86,23 @@ def compute_displacement(target_xyz_coords: np.ndarray, acquisition_time: Precis
     )
 
     # coordinates conversion: geodetic to geocentric
-    llh_coordinates = xyz2llh(target_xyz_coords.T).T
-    lat_geocentric = np.arctan((1 - 1 / 298.25642) ** 2 * np.tan(llh_coordinates[:, 0]))
+    lat_rad, lon_rad, _ = xyz2llh(target_xyz_coords.T)
+    lat_geocentric = np.arctan((1 - 1 / 298.25642) ** 2 * np.tan(lat_rad))
 
     # compute displacement unit vectors along north, east and up
-    displacement_unit_vectors = _compute_displacement_unit_vectors(
-        lat_geo_rad=lat_geocentric, lon_rad=llh_coordinates[:, 1]
-    )
+    displacement_unit_vectors = _compute_displacement_unit_vectors(lat_geo_rad=lat_geocentric, lon_rad=lon_rad)
+
+    # the tides model is evaluated only once for each distinct (lat, lon) pair, targets sharing the same position
+    # share the same displacement
+    lat_lon_deg = np.rad2deg(np.column_stack((lat_rad, lon_rad)))
+    unique_lat_lon_deg, unique_inverse = np.unique(lat_lon_deg, axis=0, return_inverse=True)
 
-    # creating an empty array of shape (N, 3), columns are: north, east and up
-    displacement_interp = np.zeros_like(target_xyz_coords)
+    # creating an empty array of shape (U, 3), columns are: north, east and up
+    displacement_interp = np.empty((unique_lat_lon_deg.shape[0], 3))
 
-    # compute displacement values for each point
-    for point_id, _ in enumerate(target_xyz_coords):
-        # converting lat and lon to deg and call the SOLID executable
-        lat_deg = np.rad2deg(llh_coordinates[point_id, 0])
-        lon_deg = np.rad2deg(llh_coordinates[point_id, 1])
+    # compute displacement values for each distinct point
+    for point_id, (lat_deg, lon_deg) in enumerate(unique_lat_lon_deg):
+        # calling the SOLID executable with lat and lon in deg
         tide_displacement_df = solid_earth_tides_core(
             year=acquisition_time.year,
             month=acquisition_time.month,
@@ -114,22 +112,18 @@ def compute_displacement(target_xyz_coords: np.ndarray, acquisition_time: Precis
         )
 
         # evaluate the interpolated displacement at the right time (in seconds relative to midnight of that day)
-        # north displacement interpolated value
-        displacement_interp[point_id, 0] = np.interp(
-            acq_time_sec, tide_displacement_df["time_s"], tide_displacement_df["north"]
-        )
-        # east displacement interpolated value
-        displacement_interp[point_id, 1] = np.interp(
-            acq_time_sec, tide_displacement_df["time_s"], tide_displacement_df["east"]
-        )
-        # up displacement interpolated value
-        displacement_interp[point_id, 2] = np.interp(
-            acq_time_sec, tide_displacement_df["time_s"], tide_displacement_df["up"]
+        # along north, east and up directions at once, clamping to the first/last sample as np.interp does
+        time_s = tide_displacement_df["time_s"].to_numpy()
+        displacement = tide_displacement_df[["north", "east", "up"]].to_numpy()
+        sample_time = np.clip(acq_time_sec, time_s[0], time_s[-1])
+        sample_id = np.clip(np.searchsorted(time_s, sample_time, side="right") - 1, 0, time_s.size - 2)
+        weight = (sample_time - time_s[sample_id]) / (time_s[sample_id + 1] - time_s[sample_id])
+        displacement_interp[point_id] = displacement[sample_id] + weight * (
+            displacement[sample_id + 1] - displacement[sample_id]
         )
 
-    # compute displacement vectors
-    north_total_displacement = displacement_interp[:, 0].reshape(-1, 1) * displacement_unit_vectors[0]
-    east_total_displacement = displacement_interp[:, 1].reshape(-1, 1) * displacement_unit_vectors[1]
-    up_total_displacement = displacement_interp[:, 2].reshape(-1, 1) * displacement_unit_vectors[2]
+    # back to one row per input point, shape (N, 3)
+    displacement_interp = displacement_interp[unique_inverse.ravel()]
 
-    return north_total_displacement + east_total_displacement + up_total_displacement
+    # compute displacement vectors summing north, east and up contributions
+    return np.einsum("nd,dnc->nc", displacement_interp, displacement_unit_vectors)
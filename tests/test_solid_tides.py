@@ -3,14 +3,55 @@
 
 """Unittest for geodynamics/solid_tides.py core functionalities"""
 
+import importlib
+import sys
+import types
 import unittest
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 from arepytools.io.metadata import PreciseDateTime
 
-from arepyextras.perturbations.geodynamics.solid_tides import compute_displacement
+try:
+    from arepyextras.perturbations.geodynamics.solid_tides import compute_displacement
+except ImportError:  # optional arepyextras-iers_solid_tides wrapper not installed
+    compute_displacement = None
 
+SOLID_TIDES_MODULE = "arepyextras.perturbations.geodynamics.solid_tides"
+SOLID_WRAPPER_MODULES = (
+    "arepyextras.iers_solid_tides",
+    "arepyextras.iers_solid_tides.wrapper",
+    "arepyextras.iers_solid_tides.wrapper.main",
+)
 
+
+def _import_solid_tides_module() -> types.ModuleType:
+    """Importing the solid tides module, replacing the optional SOLID wrapper with a placeholder if not installed"""
+    try:
+        return importlib.import_module(SOLID_TIDES_MODULE)
+    except ImportError:
+        wrapper = types.ModuleType(SOLID_WRAPPER_MODULES[-1])
+        wrapper.solid_earth_tides_core = None
+        with mock.patch.dict(sys.modules, dict.fromkeys(SOLID_WRAPPER_MODULES, wrapper)):
+            sys.modules.pop(SOLID_TIDES_MODULE, None)
+            return importlib.import_module(SOLID_TIDES_MODULE)
+
+
+def _fake_solid_earth_tides_core(year: int, month: int, day_of_month: int, lat_deg: float, lon_deg: float):
+    """Synthetic SOLID output: one sample per minute up to 23:59, displacements depending on the point position"""
+    time_s = np.arange(0, 86400, 60.0)
+    return pd.DataFrame(
+        {
+            "time_s": time_s,
+            "north": np.sin(time_s / 1e4 + np.deg2rad(lat_deg)),
+            "east": np.cos(time_s / 3e4 + np.deg2rad(lon_deg)),
+            "up": np.sin(time_s / 2e4) * lat_deg / 90,
+        }
+    )
+
+
+@unittest.skipIf(compute_displacement is None, "arepyextras-iers_solid_tides is not installed")
 class PlateTectonics(unittest.TestCase):
     """Testing solid_tides.py core functionalities"""
 
@@ -43,5 +84,63 @@ class PlateTectonics(unittest.TestCase):
         np.testing.assert_array_almost_equal(displacement, self.displacement_ref, 1e-12)
 
 
+class SolidTidesPatchedCore(unittest.TestCase):
+    """Testing solid_tides.py compute_displacement with a synthetic SOLID output"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.solid_tides = _import_solid_tides_module()
+
+    def setUp(self) -> None:
+        # creating test data, first and last target sharing the same position
+        self.pt_pos = np.array(
+            [
+                (-2468789.77437779, -4626148.4320329, 3620025.27093258),
+                (-2467963.52819618, -4626181.75345945, 3620542.41415808),
+                (-2467068.51440511, -4626651.66776616, 3620552.45331852),
+                (-2468789.77437779, -4626148.4320329, 3620025.27093258),
+            ]
+        )
+        self.unique_points = 3
+
+    def _expected_displacement(self, acq_time_s: float) -> np.ndarray:
+        """Reference displacement interpolating north, east and up components one point at a time with np.interp"""
+        lat_rad, lon_rad, _ = self.solid_tides.xyz2llh(self.pt_pos.T)
+        lat_geocentric = np.arctan((1 - 1 / 298.25642) ** 2 * np.tan(lat_rad))
+        unit_vectors = self.solid_tides._compute_displacement_unit_vectors(lat_geocentric, lon_rad)
+        expected = np.zeros_like(self.pt_pos)
+        for point_id, (lat, lon) in enumerate(zip(np.rad2deg(lat_rad), np.rad2deg(lon_rad))):
+            samples = _fake_solid_earth_tides_core(2019, 11, 16, lat, lon)
+            for direction_id, direction in enumerate(["north", "east", "up"]):
+                value = np.interp(acq_time_s, samples["time_s"], samples[direction])
+                expected[point_id] += value * unit_vectors[direction_id, point_id]
+        return expected
+
+    def test_compute_displacement(self) -> None:
+        """Testing compute_displacement function against np.interp, one SOLID call per distinct position"""
+        acq_time = PreciseDateTime.from_utc_string("16-NOV-2019 04:06:56.329529000000")
+        with mock.patch.object(
+            self.solid_tides, "solid_earth_tides_core", side_effect=_fake_solid_earth_tides_core
+        ) as solid_core:
+            displacement = self.solid_tides.compute_displacement(self.pt_pos, acq_time)
+
+        self.assertEqual(solid_core.call_count, self.unique_points)
+        self.assertEqual(displacement.shape, self.pt_pos.shape)
+        np.testing.assert_array_equal(displacement[0], displacement[-1])
+        # acquisition time is taken with whole seconds precision
+        np.testing.assert_allclose(
+            displacement, self._expected_displacement(4 * 3600 + 6 * 60 + 56), atol=1e-15, rtol=0
+        )
+
+    def test_compute_displacement_end_of_day(self) -> None:
+        """Testing compute_displacement function after the last SOLID sample of the day, clamped to it"""
+        acq_time = PreciseDateTime.from_utc_string("16-NOV-2019 23:59:45.000000000000")
+        with mock.patch.object(self.solid_tides, "solid_earth_tides_core", side_effect=_fake_solid_earth_tides_core):
+            displacement = self.solid_tides.compute_displacement(self.pt_pos, acq_time)
+
+        np.testing.assert_allclose(displacement, self._expected_displacement(86340.0), atol=1e-15, rtol=0)
+        np.testing.assert_allclose(displacement, self._expected_displacement(86385.0), atol=1e-15, rtol=0)
+
+
 if __name__ == "__main__":
     unittest.main()
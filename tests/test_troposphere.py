@@ -171,6 +171,17 @@ REF_DATE = PreciseDateTime.from_utc_string("08-JAN-2019 08:32:54.152948000000")
 class TroposphereTest(unittest.TestCase):
     """Testing atmospheric/troposphere.py functionalities"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # writing the VMF3 test maps once for the whole test class
+        cls.map_folder = TemporaryDirectory()
+        for name in ["VMF3_20190108.H00", "VMF3_20190108.H06", "VMF3_20190108.H12", "VMF3_20190108.H18"]:
+            Path(cls.map_folder.name).joinpath(name).write_text(REF_MAP, encoding="UTF-8")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.map_folder.cleanup()
+
     def setUp(self) -> None:
         # creating test data
         self.tolerance = 1e-9
@@ -239,20 +250,50 @@ class TroposphereTest(unittest.TestCase):
         pressure = tropo._troposphere_barometric_formula(height=self.heights)
         np.testing.assert_allclose(pressure, self.expected_pressures, atol=self.tolerance, rtol=0)
 
+    def test_legendre_functions(self) -> None:
+        """Testing _legendre_functions function against closed form low degree terms"""
+        x_uv, y_uv, z_uv = np.array([[0.48, 0.0], [0.6, 0.0], [0.64, 1.0]])
+        v_func, w_func = tropo._legendre_functions(x_uv=x_uv, y_uv=y_uv, z_uv=z_uv)
+        self.assertEqual(v_func.shape, (13, 13, 2))
+        np.testing.assert_allclose(v_func[1, 0], z_uv, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(v_func[1, 1], x_uv, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(w_func[1, 1], y_uv, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(v_func[2, 0], (3 * z_uv**2 - 1) / 2, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(v_func[2, 1], 3 * z_uv * x_uv, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(v_func[:, 0, 1], np.ones(13), atol=self.tolerance, rtol=0)
+        np.testing.assert_array_equal(w_func[:, 0], 0)
+
     def test_compute_tropospheric_delay(self) -> None:
         """Testing compute_delay function"""
-        with TemporaryDirectory() as tmpdir:
-            files = [
-                Path(tmpdir).joinpath(p)
-                for p in ["VMF3_20190108.H00", "VMF3_20190108.H06", "VMF3_20190108.H12", "VMF3_20190108.H18"]
-            ]
-            for file in files:
-                file.write_text(REF_MAP, encoding="UTF-8")
-            hydrostatic_delay, wet_delay = tropo.compute_delay(
-                acq_time=REF_DATE, sat_xyz_coords=self.sat_pos, targets_xyz_coords=self.target_coords, map_folder=tmpdir
-            )
-            np.testing.assert_allclose(hydrostatic_delay, self.expected_hydrostatic_delay, atol=self.tolerance, rtol=0)
-            np.testing.assert_allclose(wet_delay, self.expected_wet_delay, atol=self.tolerance, rtol=0)
+        hydrostatic_delay, wet_delay = tropo.compute_delay(
+            acq_time=REF_DATE,
+            sat_xyz_coords=self.sat_pos,
+            targets_xyz_coords=self.target_coords,
+            map_folder=self.map_folder.name,
+        )
+        np.testing.assert_allclose(hydrostatic_delay, self.expected_hydrostatic_delay, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(wet_delay, self.expected_wet_delay, atol=self.tolerance, rtol=0)
+
+    def test_compute_tropospheric_delay_cached_station_heights(self) -> None:
+        """Testing compute_delay function reusing the cached station heights interpolator"""
+        tropo.compute_delay(
+            acq_time=REF_DATE,
+            sat_xyz_coords=self.sat_pos,
+            targets_xyz_coords=self.target_coords,
+            map_folder=self.map_folder.name,
+        )
+        hits = tropo.TroposphericDelayEstimator._build_station_heights_interpolator.cache_info().hits
+        hydrostatic_delay, wet_delay = tropo.compute_delay(
+            acq_time=REF_DATE,
+            sat_xyz_coords=self.sat_pos,
+            targets_xyz_coords=self.target_coords,
+            map_folder=self.map_folder.name,
+        )
+        self.assertEqual(
+            tropo.TroposphericDelayEstimator._build_station_heights_interpolator.cache_info().hits, hits + 1
+        )
+        np.testing.assert_allclose(hydrostatic_delay, self.expected_hydrostatic_delay, atol=self.tolerance, rtol=0)
+        np.testing.assert_allclose(wet_delay, self.expected_wet_delay, atol=self.tolerance, rtol=0)
 
 
 if __name__ == "__main__":